@@ -0,0 +1,24 @@
+"""
+Shared icon cache for the calculator example.
+
+Pixmaps and icons are decoded once per path and reused by the node
+listbox and the sub-window node actions.
+
+Author: Michael Economou
+Date: 2025-12-11
+"""
+import functools
+
+from PyQt5.QtGui import QIcon, QPixmap
+
+
+@functools.cache
+def load_pixmap(path):
+    """Return the pixmap for ``path``, decoding the file only once."""
+    return QPixmap(path)
+
+
+@functools.cache
+def load_icon(path):
+    """Return an icon built from the cached pixmap for ``path``."""
+    return QIcon(load_pixmap(path))
@@ -3,8 +3,15 @@ Module description.
 Author: Michael Economou
 Date: 2025-12-11
 """
+import functools
+import importlib
+import struct
+
 LISTBOX_MIMETYPE = "application/x-item"
 
+# Listbox drag payload: op_code, utf-8 name length, then the name bytes
+_MIME_FMT = struct.Struct("<iH")
+
 OP_NODE_INPUT = 1
 OP_NODE_OUTPUT = 2
 OP_NODE_ADD = 3
@@ -13,8 +20,13 @@ OP_NODE_MUL = 5
 OP_NODE_DIV = 6
 
 
-CALC_NODES = {
-}
+# Registry is exposed as ``CALC_NODES`` through the module ``__getattr__`` so
+# node modules are only imported when the registry is first needed.
+_CALC_NODES = {}
+_SORTED_OPCODES: tuple[int, ...] = ()
+_nodes_loaded = False
+# guards re-entry while node modules, which import this module back, load
+_nodes_loading = False
 
 
 class ConfError(Exception):
@@ -29,13 +41,27 @@ class OpCodeNotRegisteredError(ConfError):
     """Raised when opcode is not registered."""
 
 
+def pack_listbox_payload(op_code, name):
+    name_b = name.encode("utf-8")
+    return _MIME_FMT.pack(op_code, len(name_b)) + name_b
+
+
+def unpack_listbox_payload(raw):
+    op_code, size = _MIME_FMT.unpack_from(raw, 0)
+    start = _MIME_FMT.size
+    return op_code, raw[start:start + size].decode("utf-8")
+
+
 def register_node_now(op_code, class_reference):
-    if op_code in CALC_NODES:
+    global _SORTED_OPCODES
+    if op_code in _CALC_NODES:
         raise InvalidNodeRegistrationError(
             f"Duplicate node registration of '{op_code}'. "
-            f"There is already {CALC_NODES[op_code]}"
+            f"There is already {_CALC_NODES[op_code]}"
         )
-    CALC_NODES[op_code] = class_reference
+    _CALC_NODES[op_code] = class_reference
+    _SORTED_OPCODES = tuple(sorted(_CALC_NODES))
+    get_class_from_opcode.cache_clear()
 
 
 def register_node(op_code):
@@ -44,12 +70,39 @@ def register_node(op_code):
         return original_class
     return decorator
 
+@functools.cache
 def get_class_from_opcode(op_code):
-    if op_code not in CALC_NODES:
-        raise OpCodeNotRegisteredError(f"OpCode '{op_code}' is not registered")
-    return CALC_NODES[op_code]
-
-
-
-# import all nodes and register them
-from examples.calculator.nodes import *
+    load_nodes()
+    try:
+        return _CALC_NODES[op_code]
+    except KeyError:
+        raise OpCodeNotRegisteredError(f"OpCode '{op_code}' is not registered") from None
+
+
+def iter_sorted_opcodes():
+    """Return registered op codes in ascending order."""
+    load_nodes()
+    return _SORTED_OPCODES
+
+
+def load_nodes():
+    """Import all node modules so their ``register_node`` decorators run."""
+    global _nodes_loaded, _nodes_loading
+    if _nodes_loaded or _nodes_loading:
+        return
+    _nodes_loading = True
+    try:
+        package = importlib.import_module("examples.calculator.nodes")
+        for name in package.__all__:
+            importlib.import_module(f"{package.__name__}.{name}")
+        _nodes_loaded = True
+    finally:
+        _nodes_loading = False
+
+
+def __getattr__(name):
+    if name == "CALC_NODES":
+        load_nodes()
+        globals()["CALC_NODES"] = _CALC_NODES
+        return _CALC_NODES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
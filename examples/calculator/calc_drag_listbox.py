@@ -3,12 +3,17 @@ Module description.
 Author: Michael Economou
 Date: 2025-12-11
 """
-from PyQt5.QtCore import QByteArray, QDataStream, QIODevice, QMimeData, QPoint, QSize, Qt
-from PyQt5.QtGui import QDrag, QIcon, QPixmap
+from PyQt5.QtCore import QByteArray, QMimeData, QPoint, QSize, Qt
+from PyQt5.QtGui import QDrag, QPixmap
 from PyQt5.QtWidgets import QAbstractItemView, QApplication, QListWidget, QListWidgetItem
 
-from examples.calculator.calc_conf import CALC_NODES, LISTBOX_MIMETYPE, get_class_from_opcode
-from node_editor.utils.helpers import dump_exception
+from examples.calculator.calc_assets import load_icon, load_pixmap
+from examples.calculator.calc_conf import (
+    LISTBOX_MIMETYPE,
+    get_class_from_opcode,
+    iter_sorted_opcodes,
+    pack_listbox_payload,
+)
 
 
 class QDMDragListbox(QListWidget):
@@ -28,17 +33,23 @@ class QDMDragListbox(QListWidget):
 
 
     def add_my_items(self):
-        keys = list(CALC_NODES.keys())
-        keys.sort()
-        for key in keys:
-            node = get_class_from_opcode(key)
-            self.add_my_item(node.op_title, node.icon, node.op_code)
+        # Populate in one batch: no repaint or itemChanged per inserted row
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for key in iter_sorted_opcodes():
+                node = get_class_from_opcode(key)
+                self.add_my_item(node.op_title, node.icon, node.op_code)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.doItemsLayout()
 
 
     def add_my_item(self, name, icon=None, op_code=0):
         item = QListWidgetItem(name, self) # can be (icon, text, parent, <int>type)
-        pixmap = QPixmap(icon if icon is not None else ".")
-        item.setIcon(QIcon(pixmap))
+        pixmap = load_pixmap(icon or ".")
+        item.setIcon(load_icon(icon or "."))
         item.setSizeHint(QSize(32, 32))
         item.setText(name)  # Set the text to display node name
 
@@ -79,14 +90,8 @@ class QDMDragListbox(QListWidget):
 
             pixmap = QPixmap(item.data(Qt.UserRole))
 
-            item_data = QByteArray()
-            data_stream = QDataStream(item_data, QIODevice.WriteOnly)
-            data_stream << pixmap
-            data_stream.writeInt(op_code)
-            data_stream.writeQString(item.text())
-
             mime_data = QMimeData()
-            mime_data.setData(LISTBOX_MIMETYPE, item_data)
+            mime_data.setData(LISTBOX_MIMETYPE, QByteArray(pack_listbox_payload(op_code, item.text())))
 
             drag = QDrag(self)
             drag.setMimeData(mime_data)
@@ -99,4 +104,6 @@ class QDMDragListbox(QListWidget):
             self._press_pos = None
 
         except Exception as e:
+            from node_editor.utils.helpers import dump_exception
+
             dump_exception(e)
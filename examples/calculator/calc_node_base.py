@@ -5,19 +5,27 @@ Date: 2025-12-11
 """
 import logging
 import os
+from collections import OrderedDict
 
-from PyQt5.QtCore import QRectF
-from PyQt5.QtGui import QImage
+from PyQt5.QtCore import QRectF, QTimer
+from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtWidgets import QLabel
 
 from node_editor.core.node import Node
 from node_editor.core.socket import LEFT_CENTER, RIGHT_CENTER
 from node_editor.graphics.node import QDMGraphicsNode
-from node_editor.utils.helpers import dump_exception
 from node_editor.widgets.content_widget import QDMNodeContentWidget
 
+logger = logging.getLogger(__name__)
+
 
 class CalcGraphicsNode(QDMGraphicsNode):
+    __slots__ = ("icons",)
+
+    # status icon atlas shared by every calculator node
+    _status_icons: QImage | None = None
+    _status_pixmap: QPixmap | None = None
+
     def init_sizes(self):
         super().init_sizes()
         self.width = 200
@@ -29,32 +37,34 @@ class CalcGraphicsNode(QDMGraphicsNode):
 
     def init_assets(self):
         super().init_assets()
-        icon_path = os.path.join(os.path.dirname(__file__), "icons", "status_icons.png")
-        self.icons = QImage(icon_path)
+        if CalcGraphicsNode._status_icons is None:
+            icon_path = os.path.join(os.path.dirname(__file__), "icons", "status_icons.png")
+            CalcGraphicsNode._status_icons = QImage(icon_path)
+            CalcGraphicsNode._status_pixmap = QPixmap.fromImage(CalcGraphicsNode._status_icons)
+        self.icons = CalcGraphicsNode._status_pixmap
 
     def paint(self, painter, option, widget=None):
         super().paint(painter, option, widget)
 
-        offset = 24.0
-        if self.node.is_dirty():
-            offset = 0.0
-        if self.node.is_invalid():
-            offset = 48.0
-
-        painter.drawImage(
+        painter.drawPixmap(
             QRectF(-10, -10, 24.0, 24.0),
             self.icons,
-            QRectF(offset, 0, 24.0, 24.0)
+            QRectF(self.node._paint_offset, 0, 24.0, 24.0)
         )
 
 
 class CalcContent(QDMNodeContentWidget):
+    __slots__ = ()
+
     def init_ui(self):
         lbl = QLabel(self.node.content_label, self)
         lbl.setObjectName(self.node.content_label_objname)
 
 
 class CalcNode(Node):
+    # base classes keep their __dict__; these attributes live in slots instead
+    __slots__ = ("value", "_eval_memo", "_paint_offset", "_eval_scheduled")
+
     icon = ""
     op_code = 0
     op_title = "Undefined"
@@ -64,14 +74,23 @@ class CalcNode(Node):
     _graphics_node_class = CalcGraphicsNode
     _content_widget_class = CalcContent
 
+    # number of recent (input1, input2) results kept per node
+    _eval_memo_size = 8
+    # set by eval_upstream_once while it drives evaluation in dependency order
+    _propagation_suspended = False
+
     def __init__(self, scene, inputs=None, outputs=None):
         if inputs is None:
             inputs = [2, 2]
         if outputs is None:
             outputs = [1]
+        # status icon atlas offset, kept in sync by mark_dirty/mark_invalid
+        self._paint_offset = 24.0
         super().__init__(scene, self.__class__.op_title, inputs, outputs)
 
         self.value = None
+        self._eval_memo = OrderedDict()
+        self._eval_scheduled = False
 
         # Set default tooltip
         self.graphics_node.setToolTip("Not evaluated yet")
@@ -85,9 +104,44 @@ class CalcNode(Node):
         self.input_socket_position = LEFT_CENTER
         self.output_socket_position = RIGHT_CENTER
 
+    def mark_dirty(self, new_value=True):
+        super().mark_dirty(new_value)
+        self._update_paint_offset()
+
+    def mark_invalid(self, new_value=True):
+        super().mark_invalid(new_value)
+        self._update_paint_offset()
+
+    def _update_paint_offset(self):
+        if self._is_invalid:
+            self._paint_offset = 48.0
+        elif self._is_dirty:
+            self._paint_offset = 0.0
+        else:
+            self._paint_offset = 24.0
+
+    def propagate_to_children(self):
+        if CalcNode._propagation_suspended:
+            return
+        self.mark_descendants_dirty()
+        self.eval_children()
+
     def eval_operation(self, _input1, _input2):
         return 123
 
+    def eval_operation_memoized(self, input1, input2):
+        # types are part of the key so 1 and 1.0 do not share a result
+        key = (type(input1), input1, type(input2), input2)
+        memo = self._eval_memo
+        if key in memo:
+            memo.move_to_end(key)
+            return memo[key]
+        val = self.eval_operation(input1, input2)
+        memo[key] = val
+        if len(memo) > self._eval_memo_size:
+            memo.popitem(last=False)
+        return val
+
     def eval_implementation(self):
         i1 = self.get_input(0)
         i2 = self.get_input(1)
@@ -95,41 +149,37 @@ class CalcNode(Node):
         if i1 is None or i2 is None:
             self.value = None
             self.mark_invalid()
-            self.mark_descendants_dirty()
             self.graphics_node.setToolTip("Connect all inputs")
-            self.eval_children()
+            self.propagate_to_children()
             return None
 
         else:
             try:
-                val = self.eval_operation(i1.eval(), i2.eval())
+                val = self.eval_operation_memoized(i1.eval(), i2.eval())
                 self.value = val
                 self.mark_dirty(False)
                 self.mark_invalid(False)
                 self.graphics_node.setToolTip(f"Result: {val}")
 
-                self.mark_descendants_dirty()
-                self.eval_children()
+                self.propagate_to_children()
 
                 return val
             except ZeroDivisionError:
                 self.value = None
                 self.mark_invalid()
                 self.graphics_node.setToolTip("Cannot divide by zero")
-                self.mark_descendants_dirty()
-                self.eval_children()
+                self.propagate_to_children()
                 return None
             except (ValueError, TypeError) as e:
                 self.value = None
                 self.mark_invalid()
                 self.graphics_node.setToolTip(f"Invalid input: {str(e)}")
-                self.mark_descendants_dirty()
-                self.eval_children()
+                self.propagate_to_children()
                 return None
 
     def eval(self):
         if not self.is_dirty() and not self.is_invalid():
-            logging.getLogger(__name__).debug(f"Returning cached {self.__class__.__name__} value: {self.value}")
+            logger.debug("Returning cached %s value: %s", self.__class__.__name__, self.value)
             return self.value
 
         try:
@@ -140,25 +190,34 @@ class CalcNode(Node):
             self.value = None
             self.mark_invalid()
             self.graphics_node.setToolTip(str(e))
-            self.mark_descendants_dirty()
-            self.eval_children()
+            self.propagate_to_children()
         except Exception as e:
             self.value = None
             self.mark_invalid()
             self.graphics_node.setToolTip(str(e))
+            from node_editor.utils.helpers import dump_exception
+
             dump_exception(e)
-            self.mark_descendants_dirty()
-            self.eval_children()
+            self.propagate_to_children()
 
 
 
     def on_input_changed(self, _socket=None):
-        logging.getLogger(__name__).debug(f"{self.__class__.__name__}::on_input_changed")
+        logger.debug("%s::on_input_changed", self.__class__.__name__)
         self.mark_dirty()
+        # coalesce bursts of input changes into one eval on the next loop pass
+        if not self._eval_scheduled:
+            self._eval_scheduled = True
+            QTimer.singleShot(0, self._run_scheduled_eval)
+
+    def _run_scheduled_eval(self):
+        self._eval_scheduled = False
+        if self.graphics_node is None:
+            # node was removed before the timer fired
+            return
         self.eval()
         # Trigger re-evaluation of all output nodes
-        self.mark_descendants_dirty()
-        self.eval_children()
+        self.propagate_to_children()
 
 
     def serialize(self):
@@ -170,5 +229,43 @@ class CalcNode(Node):
         if hashmap is None:
             hashmap = {}
         res = super().deserialize(data, hashmap, restore_id)
-        logging.getLogger(__name__).debug(f"Deserialized CalcNode '{self.__class__.__name__}', res: {res}")
+        logger.debug("Deserialized CalcNode '%s', res: %s", self.__class__.__name__, res)
         return res
+
+
+def eval_upstream_once(targets):
+    """Evaluate *targets* and their dirty upstream nodes, each at most once.
+
+    Nodes are visited dependencies first with the child cascade suspended,
+    so a subgraph shared by several targets is computed a single time.
+    """
+    order = []
+    # entered: expanded once (guards cycles); a node joins order only on exit,
+    # after all of its inputs, so the order is topological
+    entered = set()
+    for target in targets:
+        if target in entered:
+            continue
+        # iterative post-order walk over input edges
+        stack = [(target, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in entered:
+                continue
+            entered.add(node)
+            stack.append((node, True))
+            for socket in node.inputs:
+                for edge in socket.edges:
+                    upstream = edge.get_other_socket(socket).node
+                    if upstream not in entered:
+                        stack.append((upstream, False))
+
+    CalcNode._propagation_suspended = True
+    try:
+        for node in order:
+            node.eval()
+    finally:
+        CalcNode._propagation_suspended = False
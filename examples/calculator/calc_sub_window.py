@@ -6,18 +6,38 @@ Date: 2025-12-11
 import logging
 import os
 
-from PyQt5.QtCore import QDataStream, QIODevice, Qt
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QAction, QGraphicsProxyWidget, QMenu
 
-from examples.calculator.calc_conf import CALC_NODES, LISTBOX_MIMETYPE, get_class_from_opcode
+from examples.calculator.calc_assets import load_icon
+from examples.calculator.calc_conf import (
+    LISTBOX_MIMETYPE,
+    OP_NODE_OUTPUT,
+    get_class_from_opcode,
+    iter_sorted_opcodes,
+    unpack_listbox_payload,
+)
+from examples.calculator.calc_node_base import eval_upstream_once
 from node_editor.core.edge import EDGE_TYPE_BEZIER, EDGE_TYPE_DIRECT, EDGE_TYPE_SQUARE
+from node_editor.core.node import Node
+from node_editor.graphics.node import (
+    ITEM_KIND_EDGE,
+    ITEM_KIND_NODE,
+    ITEM_KIND_NONE,
+    ITEM_KIND_SOCKET,
+)
 from node_editor.graphics.view import MODE_EDGE_DRAG
-from node_editor.utils.helpers import dump_exception
 from node_editor.widgets.editor_widget import NodeEditorWidget
 
 logger = logging.getLogger(__name__)
 
+# context-menu handler per graphics item kind; anything else opens the new-node menu
+_CTX_DISPATCH = {
+    ITEM_KIND_NODE: "handle_node_context_menu",
+    ITEM_KIND_SOCKET: "handle_node_context_menu",
+    ITEM_KIND_EDGE: "handle_edge_context_menu",
+}
+
 
 def get_icon_path(relative_path):
     """Get absolute path for icon file."""
@@ -26,49 +46,65 @@ def get_icon_path(relative_path):
 
 class CalculatorSubWindow(NodeEditorWidget):
     def __init__(self):
-        logger.info("CalculatorSubWindow.__init__: Starting")
+        logger.debug("CalculatorSubWindow.__init__: Starting")
         super().__init__()
-        logger.info("CalculatorSubWindow.__init__: super().__init__() complete")
+        logger.debug("CalculatorSubWindow.__init__: super().__init__() complete")
+        self._output_nodes = set()
+        self._eval_pending = False
+        self._nodes_context_menu = None
+        self._node_context_menu = None
+        self._edge_context_menu = None
         # self.setAttribute(Qt.WA_DeleteOnClose)
 
         self.set_title()
-        logger.info("CalculatorSubWindow.__init__: Title set")
-
-        self.init_new_node_actions()
-        logger.info("CalculatorSubWindow.__init__: Node actions initialized")
+        logger.debug("CalculatorSubWindow.__init__: Title set")
 
         self.scene.add_has_been_modified_listener(self.set_title)
         self.scene.add_has_been_modified_listener(self.on_scene_modified)
         self.scene.history.add_history_restored_listener(self.on_history_restored)
+        self.scene.add_node_added_listener(self.on_node_added)
+        self.scene.add_node_removed_listener(self.on_node_removed)
         # Add drag/drop listeners directly to the view to avoid premature view access
         self.view.add_drag_enter_listener(self.on_drag_enter)
         self.view.add_drop_listener(self.on_drop)
         self.scene.set_node_class_selector(self.get_node_class_from_data)
-        logger.info("CalculatorSubWindow.__init__: Listeners registered")
+        logger.debug("CalculatorSubWindow.__init__: Listeners registered")
 
         self._close_event_listeners = []
         self._last_edge_count = 0
-        logger.info("CalculatorSubWindow.__init__: Complete")
+        logger.debug("CalculatorSubWindow.__init__: Complete")
 
     def get_node_class_from_data(self, data):
         if 'op_code' not in data:
-            from node_editor.core.node import Node
             return Node
         return get_class_from_opcode(data['op_code'])
 
+    def on_node_added(self, node):
+        if isinstance(node, get_class_from_opcode(OP_NODE_OUTPUT)):
+            self._output_nodes.add(node)
+
+    def on_node_removed(self, node):
+        self._output_nodes.discard(node)
+
     def do_eval_outputs(self):
-        # eval all output nodes
-        for node in self.scene.nodes:
-            if node.__class__.__name__ == "CalcNodeOutput":
-                node.mark_dirty()  # Force re-evaluation
-                node.value = None  # Clear cached value
-                node.eval()
+        # eval all output nodes; shared upstream nodes are computed once
+        for node in self._output_nodes:
+            node.mark_dirty()  # Force re-evaluation
+            node.value = None  # Clear cached value
+        eval_upstream_once(self._output_nodes)
 
     def on_history_restored(self):
         self.do_eval_outputs()
 
     def on_scene_modified(self):
         """Called when scene is modified - re-evaluate outputs."""
+        # bursts of modifications collapse into one pass on the next loop turn
+        if not self._eval_pending:
+            self._eval_pending = True
+            QTimer.singleShot(0, self._flush_eval)
+
+    def _flush_eval(self):
+        self._eval_pending = False
         self.do_eval_outputs()
 
     def file_load(self, filename):
@@ -80,22 +116,45 @@ class CalculatorSubWindow(NodeEditorWidget):
 
     def init_new_node_actions(self):
         self.node_actions = {}
-        keys = list(CALC_NODES.keys())
-        keys.sort()
-        for key in keys:
-            node = CALC_NODES[key]
+        for key in iter_sorted_opcodes():
+            node = get_class_from_opcode(key)
             icon_path = get_icon_path(node.icon)
-            self.node_actions[node.op_code] = QAction(QIcon(icon_path), node.op_title)
-            self.node_actions[node.op_code].setData(node.op_code)
+            self.node_actions[node.op_code] = QAction(load_icon(icon_path), node.op_title)
+            # carry the class itself so menu picks need no opcode lookup
+            self.node_actions[node.op_code].setData(node)
 
     def init_nodes_context_menu(self):
-        context_menu = QMenu(self)
-        keys = list(CALC_NODES.keys())
-        keys.sort()
-        for key in keys:
-            node = CALC_NODES[key]
-            context_menu.addAction(self.node_actions[node.op_code])
-        return context_menu
+        # node actions are fixed once registered, so the menu is built once,
+        # and only when this window first needs it
+        if self._nodes_context_menu is None:
+            self.init_new_node_actions()
+            context_menu = QMenu(self)
+            for key in iter_sorted_opcodes():
+                node = get_class_from_opcode(key)
+                context_menu.addAction(self.node_actions[node.op_code])
+            self._nodes_context_menu = context_menu
+        return self._nodes_context_menu
+
+    def init_node_context_menu(self):
+        # the node and edge menus are static too; keep their actions for comparison
+        if self._node_context_menu is None:
+            context_menu = QMenu(self)
+            self._mark_dirty_act = context_menu.addAction("Mark Dirty")
+            self._mark_dirty_descendants_act = context_menu.addAction("Mark Descendant Dirty")
+            self._mark_invalid_act = context_menu.addAction("Mark Invalid")
+            self._unmark_invalid_act = context_menu.addAction("Unmark Invalid")
+            self._eval_act = context_menu.addAction("Eval")
+            self._node_context_menu = context_menu
+        return self._node_context_menu
+
+    def init_edge_context_menu(self):
+        if self._edge_context_menu is None:
+            context_menu = QMenu(self)
+            self._bezier_act = context_menu.addAction("Bezier Edge")
+            self._direct_act = context_menu.addAction("Direct Edge")
+            self._square_act = context_menu.addAction("Square Edge")
+            self._edge_context_menu = context_menu
+        return self._edge_context_menu
 
     def set_title(self):
         self.setWindowTitle(self.get_user_friendly_filename())
@@ -116,21 +175,17 @@ class CalculatorSubWindow(NodeEditorWidget):
 
     def on_drop(self, event):
         if event.mimeData().hasFormat(LISTBOX_MIMETYPE):
-            event_data = event.mimeData().data(LISTBOX_MIMETYPE)
-            data_stream = QDataStream(event_data, QIODevice.ReadOnly)
-            pixmap = QPixmap()
-            data_stream >> pixmap
-            op_code = data_stream.readInt()
-            _ = data_stream.readQString()
+            op_code, _ = unpack_listbox_payload(bytes(event.mimeData().data(LISTBOX_MIMETYPE)))
 
-            mouse_position = event.pos()
-            scene_position = self.scene.graphics_scene.views()[0].mapToScene(mouse_position)
+            scene_position = self.view.mapToScene(event.pos())
 
             try:
                 node = get_class_from_opcode(op_code)(self.scene)
                 node.set_pos(scene_position.x(), scene_position.y())
                 self.scene.history.store_history(f"Created node {node.__class__.__name__}")
             except Exception as e:
+                from node_editor.utils.helpers import dump_exception
+
                 dump_exception(e)
 
 
@@ -142,72 +197,58 @@ class CalculatorSubWindow(NodeEditorWidget):
 
     def contextMenuEvent(self, event):
         try:
-            item = self.scene.get_item_at(event.pos())
+            # hit-test once; the handlers act on the item resolved here
+            item = self.view.getItemAtClick(event)
 
             if isinstance(item, QGraphicsProxyWidget):
                 item = item.widget()
 
-            if hasattr(item, 'node') or hasattr(item, 'socket'):
-                self.handle_node_context_menu(event)
-            elif hasattr(item, 'edge'):
-                self.handle_edge_context_menu(event)
-            #elif item is None:
-            else:
-                self.handle_new_node_context_menu(event)
+            handler = _CTX_DISPATCH.get(getattr(item, 'item_kind', ITEM_KIND_NONE), "handle_new_node_context_menu")
+            getattr(self, handler)(event, item)
 
             return super().contextMenuEvent(event)
         except Exception as e:
+            from node_editor.utils.helpers import dump_exception
+
             dump_exception(e)
 
-    def handle_node_context_menu(self, event):
-        context_menu = QMenu(self)
-        mark_dirty_act = context_menu.addAction("Mark Dirty")
-        mark_dirty_descendants_act = context_menu.addAction("Mark Descendant Dirty")
-        mark_invalid_act = context_menu.addAction("Mark Invalid")
-        unmark_invalid_act = context_menu.addAction("Unmark Invalid")
-        eval_act = context_menu.addAction("Eval")
+    def handle_node_context_menu(self, event, item):
+        context_menu = self.init_node_context_menu()
         action = context_menu.exec_(self.mapToGlobal(event.pos()))
 
         selected = None
-        item = self.scene.get_item_at(event.pos())
-        if isinstance(item, QGraphicsProxyWidget):
-            item = item.widget()
-
-        if hasattr(item, 'node'):
+        kind = getattr(item, 'item_kind', ITEM_KIND_NONE)
+        if kind == ITEM_KIND_NODE:
             selected = item.node
-        if hasattr(item, 'socket'):
+        elif kind == ITEM_KIND_SOCKET:
             selected = item.socket.node
 
-        if selected and action == mark_dirty_act:
+        if selected and action == self._mark_dirty_act:
             selected.mark_dirty()
-        if selected and action == mark_dirty_descendants_act:
+        if selected and action == self._mark_dirty_descendants_act:
             selected.mark_descendants_dirty()
-        if selected and action == mark_invalid_act:
+        if selected and action == self._mark_invalid_act:
             selected.mark_invalid()
-        if selected and action == unmark_invalid_act:
+        if selected and action == self._unmark_invalid_act:
             selected.mark_invalid(False)
-        if selected and action == eval_act:
+        if selected and action == self._eval_act:
             val = selected.eval()
             logger.info("Evaluated node %s with result %s", selected.__class__.__name__, val)
 
 
-    def handle_edge_context_menu(self, event):
-        context_menu = QMenu(self)
-        bezier_act = context_menu.addAction("Bezier Edge")
-        direct_act = context_menu.addAction("Direct Edge")
-        square_act = context_menu.addAction("Square Edge")
+    def handle_edge_context_menu(self, event, item):
+        context_menu = self.init_edge_context_menu()
         action = context_menu.exec_(self.mapToGlobal(event.pos()))
 
         selected = None
-        item = self.scene.get_item_at(event.pos())
-        if hasattr(item, 'edge'):
+        if getattr(item, 'item_kind', ITEM_KIND_NONE) == ITEM_KIND_EDGE:
             selected = item.edge
 
-        if selected and action == bezier_act:
+        if selected and action == self._bezier_act:
             selected.edge_type = EDGE_TYPE_BEZIER
-        if selected and action == direct_act:
+        if selected and action == self._direct_act:
             selected.edge_type = EDGE_TYPE_DIRECT
-        if selected and action == square_act:
+        if selected and action == self._square_act:
             selected.edge_type = EDGE_TYPE_SQUARE
 
     # helper functions
@@ -227,20 +268,21 @@ class CalculatorSubWindow(NodeEditorWidget):
         new_calc_node.graphics_node.on_selected()
 
 
-    def handle_new_node_context_menu(self, event):
+    def handle_new_node_context_menu(self, event, _item=None):
         context_menu = self.init_nodes_context_menu()
         action = context_menu.exec_(self.mapToGlobal(event.pos()))
 
         if action is not None:
-            new_calc_node = get_class_from_opcode(action.data())(self.scene)
-            scene_pos = self.scene.get_view().mapToScene(event.pos())
+            new_calc_node = action.data()(self.scene)
+            view = self.view
+            scene_pos = view.mapToScene(event.pos())
             new_calc_node.set_pos(scene_pos.x(), scene_pos.y())
 
-            if self.scene.get_view().mode == MODE_EDGE_DRAG:
+            if view.mode == MODE_EDGE_DRAG:
                 # if we were dragging an edge...
-                target_socket = self.determine_target_socket_of_node(self.scene.get_view().dragging.drag_start_socket.is_output, new_calc_node)
+                target_socket = self.determine_target_socket_of_node(view.dragging.drag_start_socket.is_output, new_calc_node)
                 if target_socket is not None:
-                    self.scene.get_view().dragging.edge_drag_end(target_socket.graphics_socket)
+                    view.dragging.edge_drag_end(target_socket.graphics_socket)
                     self.finish_new_node_state(new_calc_node)
 
             else:
@@ -6,9 +6,17 @@ Date: 2025-12-11
 import logging
 import os
 
-from PyQt5.QtCore import QSignalMapper, Qt, QTimer
+from PyQt5.QtCore import QSettings, Qt, QTimer
 from PyQt5.QtGui import QIcon, QKeySequence
-from PyQt5.QtWidgets import QAction, QDockWidget, QFileDialog, QMdiArea, QMessageBox
+from PyQt5.QtWidgets import (
+    QAction,
+    QApplication,
+    QDockWidget,
+    QFileDialog,
+    QMdiArea,
+    QMessageBox,
+    QWidget,
+)
 
 from examples.calculator.calc_drag_listbox import QDMDragListbox
 from examples.calculator.calc_sub_window import CalculatorSubWindow
@@ -20,7 +28,7 @@ from node_editor.tools.edge_validators import (
     edge_cannot_connect_two_outputs_or_two_inputs,
 )
 from node_editor.utils.helpers import dump_exception
-from node_editor.utils.qt_helpers import loadStylesheets
+from node_editor.utils.qt_helpers import read_stylesheets
 from node_editor.widgets.editor_window import NodeEditorWindow
 
 Edge.register_edge_validator(edge_cannot_connect_two_outputs_or_two_inputs)
@@ -28,25 +36,61 @@ Edge.register_edge_validator(edge_cannot_connect_input_and_output_of_same_node)
 
 logger = logging.getLogger(__name__)
 
+_MODULE_DIR = os.path.dirname(__file__)
+_QSS_DEFAULT = os.path.join(_MODULE_DIR, "qss/nodeeditor.qss")
+_QSS_DARK = os.path.join(_MODULE_DIR, "qss/nodeeditor-dark.qss")
+
+# marks the active-widget cache as needing a fresh activeSubWindow() lookup
+_UNSET = object()
+
+# merged QSS text, re-read only when one of the files changes on disk
+_CACHED_QSS: str | None = None
+_CACHED_QSS_MTIMES: tuple | None = None
+
+
+def _get_stylesheet(*filenames):
+    global _CACHED_QSS, _CACHED_QSS_MTIMES
+    mtimes = tuple(os.stat(f).st_mtime_ns if os.path.exists(f) else None for f in filenames)
+    if _CACHED_QSS is None or mtimes != _CACHED_QSS_MTIMES:
+        _CACHED_QSS = read_stylesheets(*filenames)
+        _CACHED_QSS_MTIMES = mtimes
+    return _CACHED_QSS
+
+
+def _set_if_changed(act, enabled):
+    # skip setEnabled (and the changed() it emits) when the state already matches
+    if act.isEnabled() != enabled:
+        act.setEnabled(enabled)
+
 class CalculatorWindow(NodeEditorWindow):
 
     def init_ui(self):
         self.name_company = 'oncut'
         self.name_product = 'Calculator Node Editor'
 
-        self.stylesheet_filename = os.path.join(os.path.dirname(__file__), "qss/nodeeditor.qss")
-        loadStylesheets(
-            os.path.join(os.path.dirname(__file__), "qss/nodeeditor-dark.qss"),
-            self.stylesheet_filename
-        )
+        self.stylesheet_filename = _QSS_DEFAULT
+        QApplication.instance().setStyleSheet(_get_stylesheet(_QSS_DARK, _QSS_DEFAULT))
 
         self.empty_icon = QIcon(".")
-
+        self._last_window_menu_sig = None
+        # Window menu: static part built once, then a pool of per-window actions
+        # that are retitled and hidden instead of being recreated
+        self._toolbar_nodes_act = None
+        self._window_action_pool = []
+        self._window_menu_targets = []
+        self._edit_menu_update_scheduled = False
+        # open files by name, kept in sync on create, save-as and close
+        self._mdi_by_filename = {}
+        self._open_dialog = None
+        self._about_box = None
+        # last applied menu states, so repeated activations are no-ops
+        self._last_has_child = None
+        self._last_edit_menu_state = None
+        self._last_dir = ''
+        # active node editor, resolved once per subWindowActivated
+        self._active_widget_cache = _UNSET
 
         self.mdiArea = QMdiArea()
-        # Mapper to activate MDI child windows from menu actions
-        self.windowMapper = QSignalMapper(self)
-        self.windowMapper.mapped.connect(lambda w: self.mdiArea.setActiveSubWindow(w))
         self.mdiArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.mdiArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.mdiArea.setViewMode(QMdiArea.ViewMode.TabbedView)
@@ -55,6 +99,8 @@ class CalculatorWindow(NodeEditorWindow):
         self.mdiArea.setTabsMovable(True)
         self.setCentralWidget(self.mdiArea)
 
+        # connected first so update_menus never sees a stale active widget
+        self.mdiArea.subWindowActivated.connect(self._invalidate_active_widget)
         self.mdiArea.subWindowActivated.connect(self.update_menus)
 
         self.create_nodes_dock()
@@ -81,6 +127,33 @@ class CalculatorWindow(NodeEditorWindow):
             sys.exit(0)
 
 
+    def read_settings(self):
+        super().read_settings()
+        settings = QSettings(self.name_company, self.name_product)
+        self._last_dir = settings.value('last_dir', '')
+
+    def write_settings(self):
+        super().write_settings()
+        settings = QSettings(self.name_company, self.name_product)
+        settings.setValue('last_dir', self._last_dir)
+
+    def get_file_dialog_directory(self):
+        return self._last_dir
+
+    def get_open_dialog(self):
+        # one dialog per window: it keeps its directory and filter between opens
+        if self._open_dialog is None:
+            dlg = QFileDialog(
+                self,
+                'Open graph from file',
+                self.get_file_dialog_directory(),
+                self.get_file_dialog_filter(),
+            )
+            dlg.setFileMode(QFileDialog.ExistingFiles)
+            dlg.setOptions(QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks)
+            self._open_dialog = dlg
+        return self._open_dialog
+
     def create_actions(self):
         super().create_actions()
 
@@ -98,22 +171,25 @@ class CalculatorWindow(NodeEditorWindow):
 
     def get_current_node_editor_widget(self):
         """ we're returning NodeEditorWidget here... """
-        active_sub_window = self.mdiArea.activeSubWindow()
-        if active_sub_window:
-            return active_sub_window.widget()
-        return None
+        if self._active_widget_cache is _UNSET:
+            active_sub_window = self.mdiArea.activeSubWindow()
+            self._active_widget_cache = active_sub_window.widget() if active_sub_window else None
+        return self._active_widget_cache
+
+    def _invalidate_active_widget(self, *_args):
+        self._active_widget_cache = _UNSET
 
     def on_file_new(self):
-        logger.info("on_file_new: Starting")
+        logger.debug("on_file_new: Starting")
         def _do_new():
             try:
-                logger.info("on_file_new: Creating MDI child")
+                logger.debug("on_file_new: Creating MDI child")
                 subwnd = self.create_mdi_child()
-                logger.info("on_file_new: Calling file_new on widget")
+                logger.debug("on_file_new: Calling file_new on widget")
                 subwnd.widget().file_new()
-                logger.info("on_file_new: Showing subwindow")
+                logger.debug("on_file_new: Showing subwindow")
                 subwnd.show()
-                logger.info("on_file_new: Complete")
+                logger.debug("on_file_new: Complete")
             except Exception as exc:
                 logger.error("on_file_new: Exception occurred", exc_info=True)
                 dump_exception(exc)
@@ -123,12 +199,11 @@ class CalculatorWindow(NodeEditorWindow):
 
 
     def on_file_open(self):
-        fnames, filter = QFileDialog.getOpenFileNames(
-            self,
-            'Open graph from file',
-            self.get_file_dialog_directory(),
-            self.get_file_dialog_filter(),
-        )
+        dlg = self.get_open_dialog()
+        if not dlg.exec_():
+            return
+        fnames = dlg.selectedFiles()
+        self._last_dir = dlg.directory().absolutePath()
 
         def _do_open(fname: str):
             try:
@@ -155,10 +230,17 @@ class CalculatorWindow(NodeEditorWindow):
 
 
     def about(self):
-        QMessageBox.about(self, "About Calculator NodeEditor Example",
+        # the rich text is parsed and laid out once, on first open
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About Calculator NodeEditor Example")
+            self._about_box.setTextFormat(Qt.RichText)
+            self._about_box.setText(
                 "The <b>Calculator NodeEditor</b> example demonstrates how to write multiple "
                 "document interface applications using PyQt5 and NodeEditor. For more information visit: "
-                "<a href='https://www.blenderfreak.com/'>www.BlenderFreak.com</a>")
+                "<a href='https://www.blenderfreak.com/'>www.BlenderFreak.com</a>"
+            )
+        self._about_box.exec_()
 
     def create_menus(self):
         super().create_menus()
@@ -178,71 +260,105 @@ class CalculatorWindow(NodeEditorWindow):
         active = self.get_current_node_editor_widget()
         has_mdi_child = (active is not None)
 
-        self.actSave.setEnabled(has_mdi_child)
-        self.actSaveAs.setEnabled(has_mdi_child)
-        self.actClose.setEnabled(has_mdi_child)
-        self.actCloseAll.setEnabled(has_mdi_child)
-        self.actTile.setEnabled(has_mdi_child)
-        self.actCascade.setEnabled(has_mdi_child)
-        self.actNext.setEnabled(has_mdi_child)
-        self.actPrevious.setEnabled(has_mdi_child)
-        self.actSeparator.setVisible(has_mdi_child)
+        if has_mdi_child != self._last_has_child:
+            self._last_has_child = has_mdi_child
+            for act in (self.actSave, self.actSaveAs, self.actClose, self.actCloseAll,
+                        self.actTile, self.actCascade, self.actNext, self.actPrevious):
+                _set_if_changed(act, has_mdi_child)
+            self.actSeparator.setVisible(has_mdi_child)
 
-        self.update_edit_menu()
+        # Undo/Redo shortcuts only fire on enabled actions, so the edit state
+        # can't wait for aboutToShow; coalesce it to once per loop pass instead.
+        self._schedule_edit_menu_update()
 
     def update_edit_menu(self):
         try:
             active = self.get_current_node_editor_widget()
             has_mdi_child = (active is not None)
-
-            self.actPaste.setEnabled(has_mdi_child)
-
-            self.actCut.setEnabled(has_mdi_child and active.has_selected_items())
-            self.actCopy.setEnabled(has_mdi_child and active.has_selected_items())
-            self.actDelete.setEnabled(has_mdi_child and active.has_selected_items())
-
-            self.actUndo.setEnabled(has_mdi_child and active.can_undo())
-            self.actRedo.setEnabled(has_mdi_child and active.can_redo())
+            has_selection = has_mdi_child and active.has_selected_items()
+            can_undo = has_mdi_child and active.can_undo()
+            can_redo = has_mdi_child and active.can_redo()
+
+            state = (has_mdi_child, has_selection, can_undo, can_redo)
+            if state == self._last_edit_menu_state:
+                return
+            self._last_edit_menu_state = state
+
+            _set_if_changed(self.actPaste, has_mdi_child)
+            _set_if_changed(self.actCut, has_selection)
+            _set_if_changed(self.actCopy, has_selection)
+            _set_if_changed(self.actDelete, has_selection)
+            _set_if_changed(self.actUndo, can_undo)
+            _set_if_changed(self.actRedo, can_redo)
         except Exception as e:
             dump_exception(e)
 
+    def _schedule_edit_menu_update(self):
+        # history bursts (paste, multi-delete) refresh the menu once per loop pass
+        if not self._edit_menu_update_scheduled:
+            self._edit_menu_update_scheduled = True
+            QTimer.singleShot(0, self._do_edit_menu_update)
 
+    def _do_edit_menu_update(self):
+        self._edit_menu_update_scheduled = False
+        self.update_edit_menu()
 
     def update_window_menu(self):
-        self.windowMenu.clear()
-
-        toolbar_nodes = self.windowMenu.addAction("Nodes Toolbar")
-        toolbar_nodes.setCheckable(True)
-        toolbar_nodes.triggered.connect(self.on_window_nodes_toolbar)
-        toolbar_nodes.setChecked(self.nodesDock.isVisible())
-
-        self.windowMenu.addSeparator()
-
-        self.windowMenu.addAction(self.actClose)
-        self.windowMenu.addAction(self.actCloseAll)
-        self.windowMenu.addSeparator()
-        self.windowMenu.addAction(self.actTile)
-        self.windowMenu.addAction(self.actCascade)
-        self.windowMenu.addSeparator()
-        self.windowMenu.addAction(self.actNext)
-        self.windowMenu.addAction(self.actPrevious)
-        self.windowMenu.addAction(self.actSeparator)
-
         windows = self.mdiArea.subWindowList()
+        current = self.get_current_node_editor_widget()
+        # The window objects themselves (not id()) go in the signature so a
+        # closed window can never match a new one reusing its address.
+        sig = (self.nodesDock.isVisible(),) + tuple(
+            (window, window.widget().get_user_friendly_filename(), window.widget() is current)
+            for window in windows
+        )
+        if sig == self._last_window_menu_sig:
+            return
+        self._last_window_menu_sig = sig
+
+        if self._toolbar_nodes_act is None:
+            self._toolbar_nodes_act = self.windowMenu.addAction("Nodes Toolbar")
+            self._toolbar_nodes_act.setCheckable(True)
+            self._toolbar_nodes_act.triggered.connect(self.on_window_nodes_toolbar)
+
+            self.windowMenu.addSeparator()
+
+            self.windowMenu.addAction(self.actClose)
+            self.windowMenu.addAction(self.actCloseAll)
+            self.windowMenu.addSeparator()
+            self.windowMenu.addAction(self.actTile)
+            self.windowMenu.addAction(self.actCascade)
+            self.windowMenu.addSeparator()
+            self.windowMenu.addAction(self.actNext)
+            self.windowMenu.addAction(self.actPrevious)
+            self.windowMenu.addAction(self.actSeparator)
+
+        self._toolbar_nodes_act.setChecked(self.nodesDock.isVisible())
         self.actSeparator.setVisible(len(windows) != 0)
 
-        for i, window in enumerate(windows):
-            child = window.widget()
+        self._window_menu_targets = windows
+        pool = self._window_action_pool
+        while len(pool) < len(windows):
+            action = self.windowMenu.addAction("")
+            action.setCheckable(True)
+            action.triggered.connect(
+                lambda _checked=False, i=len(pool): self.mdiArea.setActiveSubWindow(self._window_menu_targets[i])
+            )
+            pool.append(action)
+
+        for i, action in enumerate(pool):
+            if i >= len(windows):
+                action.setVisible(False)
+                continue
+            child = windows[i].widget()
 
             text = f"{i + 1} {child.get_user_friendly_filename()}"
             if i < 9:
                 text = '&' + text
 
-            action = self.windowMenu.addAction(text)
-            action.setCheckable(True)
-            action.setChecked(child is self.get_current_node_editor_widget())
-            action.triggered.connect(self.windowMapper.map)
-            self.windowMapper.setMapping(action, window)
+            action.setText(text)
+            action.setChecked(child is current)
+            action.setVisible(True)
 
     def on_window_nodes_toolbar(self):
         if self.nodesDock.isVisible():
@@ -254,46 +370,65 @@ class CalculatorWindow(NodeEditorWindow):
         pass
 
     def create_nodes_dock(self):
-        self.nodesListWidget = QDMDragListbox()
+        # the listbox loads every node icon; build it after the dock first
+        # becomes visible so the main window paints before the palette fills
+        self.nodesListWidget = None
 
         self.nodesDock = QDockWidget("Nodes")
-        self.nodesDock.setWidget(self.nodesListWidget)
+        self.nodesDock.setWidget(QWidget())
         self.nodesDock.setFloating(False)
+        self.nodesDock.visibilityChanged.connect(self.on_nodes_dock_visibility_changed)
 
         self.addDockWidget(Qt.RightDockWidgetArea, self.nodesDock)
 
+    def on_nodes_dock_visibility_changed(self, visible):
+        if visible:
+            self.nodesDock.visibilityChanged.disconnect(self.on_nodes_dock_visibility_changed)
+            QTimer.singleShot(0, self._build_nodes_listbox)
+
+    def _build_nodes_listbox(self):
+        if self.nodesListWidget is None:
+            self.nodesListWidget = QDMDragListbox()
+            self.nodesDock.setWidget(self.nodesListWidget)
+
     def create_status_bar(self):
         self.statusBar().showMessage("Ready")
 
     def create_mdi_child(self, child_widget=None):
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info("create_mdi_child: Starting")
+        logger.debug("create_mdi_child: Starting")
         nodeeditor = child_widget if child_widget is not None else CalculatorSubWindow()
-        logger.info("create_mdi_child: CalculatorSubWindow created")
+        logger.debug("create_mdi_child: CalculatorSubWindow created")
         subwnd = self.mdiArea.addSubWindow(nodeeditor)
-        logger.info("create_mdi_child: Added to MDI area")
+        self._invalidate_active_widget()
+        logger.debug("create_mdi_child: Added to MDI area")
         subwnd.setWindowIcon(self.empty_icon)
         # nodeeditor.scene.add_item_selected_listener(self.updateEditMenu)
         # nodeeditor.scene.add_items_deselected_listener(self.updateEditMenu)
-        nodeeditor.scene.history.add_history_modified_listener(self.update_edit_menu)
-        logger.info("create_mdi_child: Added history listener")
+        nodeeditor.scene.history.add_history_modified_listener(self._schedule_edit_menu_update)
+        logger.debug("create_mdi_child: Added history listener")
         nodeeditor.add_close_event_listener(self.on_sub_wnd_close)
-        logger.info("create_mdi_child: Complete")
+        if nodeeditor.filename is not None:
+            self._mdi_by_filename[nodeeditor.filename] = subwnd
+        logger.debug("create_mdi_child: Complete")
         return subwnd
 
     def on_sub_wnd_close(self, widget, event):
-        existing = self.find_mdi_child(widget.filename)
+        # the QMdiSubWindow is the widget's parent; untitled windows have no filename
+        existing = widget.parentWidget()
         self.mdiArea.setActiveSubWindow(existing)
+        self._invalidate_active_widget()
 
         if self.maybe_save():
+            if self._mdi_by_filename.get(widget.filename) is existing:
+                del self._mdi_by_filename[widget.filename]
             event.accept()
         else:
             event.ignore()
 
+    def on_before_save_as(self, current_nodeeditor, filename):
+        subwnd = current_nodeeditor.parentWidget()
+        self._mdi_by_filename.pop(current_nodeeditor.filename, None)
+        self._mdi_by_filename[filename] = subwnd
 
     def find_mdi_child(self, filename):
-        for window in self.mdiArea.subWindowList():
-            if window.widget().filename == filename:
-                return window
-        return None
+        return self._mdi_by_filename.get(filename)
@@ -25,7 +25,9 @@ from node_editor.utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
 
-if __name__ == '__main__':
+
+def main():
+    """Configure logging, open the calculator window and run the event loop."""
     setup_logging()
     logger.info("Starting Calculator Example")
 
@@ -39,3 +41,7 @@ if __name__ == '__main__':
     exit_code = app.exec_()
     logger.info("Calculator exiting with code %d", exit_code)
     sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,11 +4,16 @@ Author: Michael Economou
 Date: 2025-12-11
 """
 
+# Node modules imported by calc_conf.load_nodes(). Keep this list in sync when
+# adding a module; set CALC_DEV_AUTODISCOVER=1 to scan the package directory
+# instead while developing.
+__all__ = ["input", "operations", "output"]
 
-# __all__ = [ "operations", "input", "output" ]
+import os
 
-import glob
-from os.path import basename, dirname, isfile, join
+if os.environ.get("CALC_DEV_AUTODISCOVER"):
+    import glob
+    from os.path import basename, dirname, isfile, join
 
-modules = glob.glob(join(dirname(__file__), "*.py"))
-__all__ = [ basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py')]
+    modules = glob.glob(join(dirname(__file__), "*.py"))
+    __all__ = [basename(f)[:-3] for f in modules if isfile(f) and not f.endswith('__init__.py')]
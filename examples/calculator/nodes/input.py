@@ -13,10 +13,8 @@ from examples.calculator.calc_node_base import CalcGraphicsNode, CalcNode
 from node_editor.utils.helpers import dump_exception
 from node_editor.widgets.content_widget import QDMNodeContentWidget
 
-
-def get_icon_path(relative_path):
-    """Get absolute path for icon file."""
-    return os.path.join(os.path.dirname(__file__), "..", relative_path)
+# resolved once at import; node classes append their file name
+_ICON_BASE = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "icons"))
 
 
 class CalcInputContent(QDMNodeContentWidget):
@@ -46,7 +44,7 @@ class CalcInputContent(QDMNodeContentWidget):
 
 @register_node(OP_NODE_INPUT)
 class CalcNodeInput(CalcNode):
-    icon = get_icon_path("icons/in.png")
+    icon = _ICON_BASE + "/in.png"
     op_code = OP_NODE_INPUT
     op_title = "Input"
     content_label_objname = "calc_node_input"
@@ -59,20 +57,47 @@ class CalcNodeInput(CalcNode):
     def init_inner_classes(self):
         self.content = CalcInputContent(self)
         self.graphics_node = CalcGraphicsNode(self)
+        # last value pushed to children; None until one has been
+        self._last_emitted = None
+        self.on_text_changed(self.content.edit.text())
+        # parse first, so on_input_changed sees the new cached value
+        self.content.edit.textChanged.connect(self.on_text_changed)
         self.content.edit.textChanged.connect(self.on_input_changed)
 
+    def on_text_changed(self, text):
+        try:
+            self._cached_value = int(text)
+            self._parse_error = None
+        except ValueError as e:
+            self._cached_value = None
+            self._parse_error = str(e)
+
+    def _run_scheduled_eval(self):
+        # eval_implementation propagates by itself, and only on a new value
+        self._eval_scheduled = False
+        if self.graphics_node is None:
+            return
+        self.eval()
+
     def eval_implementation(self):
-        u_value = self.content.edit.text()
-        s_value = int(u_value)
-        self.value = s_value
+        if self._cached_value is None:
+            self._last_emitted = None
+            raise ValueError(self._parse_error)
+
+        self.value = self._cached_value
         self.mark_dirty(False)
         self.mark_invalid(False)
 
+        if self.value == self._last_emitted:
+            return self.value
+        self._last_emitted = self.value
+
         self.mark_descendants_invalid(False)
-        self.mark_descendants_dirty()
 
-        self.graphics_node.setToolTip(f"Value: {self.value}")
+        tooltip = f"Value: {self.value}"
+        if self.graphics_node.toolTip() != tooltip:
+            self.graphics_node.setToolTip(tooltip)
 
-        self.eval_children()
+        self.propagate_to_children()
 
         return self.value
@@ -14,15 +14,13 @@ from examples.calculator.calc_conf import (
 )
 from examples.calculator.calc_node_base import CalcNode
 
-
-def get_icon_path(relative_path):
-    """Get absolute path for icon file."""
-    return os.path.join(os.path.dirname(__file__), "..", relative_path)
+# resolved once at import; node classes append their file name
+_ICON_BASE = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "icons"))
 
 
 @register_node(OP_NODE_ADD)
 class CalcNodeAdd(CalcNode):
-    icon = get_icon_path("icons/add.png")
+    icon = _ICON_BASE + "/add.png"
     op_code = OP_NODE_ADD
     op_title = "Add"
     content_label = "+"
@@ -34,7 +32,7 @@ class CalcNodeAdd(CalcNode):
 
 @register_node(OP_NODE_SUB)
 class CalcNodeSub(CalcNode):
-    icon = get_icon_path("icons/sub.png")
+    icon = _ICON_BASE + "/sub.png"
     op_code = OP_NODE_SUB
     op_title = "Substract"
     content_label = "-"
@@ -45,7 +43,7 @@ class CalcNodeSub(CalcNode):
 
 @register_node(OP_NODE_MUL)
 class CalcNodeMul(CalcNode):
-    icon = get_icon_path("icons/mul.png")
+    icon = _ICON_BASE + "/mul.png"
     op_code = OP_NODE_MUL
     op_title = "Multiply"
     content_label = "*"
@@ -56,7 +54,7 @@ class CalcNodeMul(CalcNode):
 
 @register_node(OP_NODE_DIV)
 class CalcNodeDiv(CalcNode):
-    icon = get_icon_path("icons/divide.png")
+    icon = _ICON_BASE + "/divide.png"
     op_code = OP_NODE_DIV
     op_title = "Divide"
     content_label = "/"
@@ -3,6 +3,7 @@ Module description.
 Author: Michael Economou
 Date: 2025-12-11
 """
+import bisect
 import os
 
 from PyQt5.QtCore import Qt
@@ -12,10 +13,15 @@ from examples.calculator.calc_conf import OP_NODE_OUTPUT, register_node
 from examples.calculator.calc_node_base import CalcGraphicsNode, CalcNode
 from node_editor.widgets.content_widget import QDMNodeContentWidget
 
+# resolved once at import; node classes append their file name
+_ICON_BASE = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "icons"))
 
-def get_icon_path(relative_path):
-    """Get absolute path for icon file."""
-    return os.path.join(os.path.dirname(__file__), "..", relative_path)
+
+_NUM_TYPES = (int, float)
+# 10**k for k in 0..9: bisect gives the integer digit count of values in [1, 1e10)
+_POW10 = tuple(10.0 ** k for k in range(10))
+# "{:.Nf}" templates indexed by decimal places
+_FMT = tuple(f"{{:.{i}f}}" for i in range(11))
 
 
 def format_number(value):
@@ -26,11 +32,11 @@ def format_number(value):
     - Decimals up to 10 total digits with rounding (20/3 -> 6.666666667)
     - Very large/small numbers use exponential notation
     """
-    if not isinstance(value, int | float):
+    if not isinstance(value, _NUM_TYPES):
         return str(value)
 
     # Check if it's effectively an integer (including Python int type)
-    if isinstance(value, int) or (isinstance(value, float) and value == int(value)):
+    if isinstance(value, int) or value.is_integer():
         return str(int(value))
 
     # Handle very large or very small numbers with exponential notation
@@ -41,23 +47,22 @@ def format_number(value):
     # Format with up to 10 total significant digits (for non-integer floats)
     # Calculate how many decimal places we can afford
     if abs_value >= 1:
-        int_digits = len(str(int(abs_value)))
+        int_digits = bisect.bisect_right(_POW10, abs_value)
         decimal_places = max(1, 10 - int_digits)  # At least 1 decimal for floats
     else:
         decimal_places = 9
 
-    formatted = f"{value:.{decimal_places}f}"
+    formatted = _FMT[decimal_places].format(value)
     # Strip trailing zeros after decimal point
-    if '.' in formatted:
-        formatted = formatted.rstrip('0').rstrip('.')
-
-    return formatted
+    head, _, frac = formatted.partition('.')
+    frac = frac.rstrip('0')
+    return head + '.' + frac if frac else head
 
 
 @register_node(OP_NODE_OUTPUT)
 class CalcNodeOutput(CalcNode):
     """Node for displaying output values."""
-    icon = get_icon_path("icons/out.png")
+    icon = _ICON_BASE + "/out.png"
     op_code = OP_NODE_OUTPUT
     op_title = "Output"
     content_label_objname = "calc_node_output"
@@ -70,11 +75,17 @@ class CalcNodeOutput(CalcNode):
         self.content = CalcOutputContent(self)
         self.graphics_node = CalcGraphicsNode(self)
 
+    def show_result(self, text, tooltip):
+        # label and tooltip writes restyle and repaint; skip them when unchanged
+        if self.content.lbl.text() != text:
+            self.content.lbl.setText(text)
+        if self.graphics_node.toolTip() != tooltip:
+            self.graphics_node.setToolTip(tooltip)
+
     def eval_implementation(self):
         input_node = self.get_input(0)
         if not input_node:
-            self.content.lbl.setText("--")
-            self.graphics_node.setToolTip("Input is not connected")
+            self.show_result("--", "Input is not connected")
             self.mark_dirty()
             self.mark_invalid(False)
             return
@@ -83,8 +94,7 @@ class CalcNodeOutput(CalcNode):
         # This prevents stale values and avoids recursion when upstream nodes
         # propagate evaluation to children on errors.
         if input_node.is_invalid():
-            self.content.lbl.setText("--")
-            self.graphics_node.setToolTip("Input has an error")
+            self.show_result("--", "Input has an error")
             self.mark_dirty()
             self.mark_invalid(False)
             return
@@ -92,17 +102,15 @@ class CalcNodeOutput(CalcNode):
         val = input_node.eval()
 
         if val is None:
-            self.content.lbl.setText("--")
-            self.graphics_node.setToolTip("Input is invalid")
+            self.show_result("--", "Input is invalid")
             self.mark_dirty()
             self.mark_invalid(False)
             return
 
         formatted_val = format_number(val)
-        self.content.lbl.setText(formatted_val)
+        self.show_result(formatted_val, f"Output: {formatted_val}")
         self.mark_invalid(False)
         self.mark_dirty(False)
-        self.graphics_node.setToolTip(f"Output: {formatted_val}")
 
         return val
 
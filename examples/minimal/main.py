@@ -22,22 +22,22 @@ Author:
 Date:
     2025-12-11
 """
-import inspect
 import os
 import sys
 
-from PyQt5.QtWidgets import QApplication
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from node_editor.utils.qt_helpers import loadStylesheet
-from node_editor.widgets.editor_window import NodeEditorWindow
-
 if __name__ == "__main__":
+    # deferred so importing this module stays cheap
+    from PyQt5.QtWidgets import QApplication
+
+    from node_editor.utils.qt_helpers import loadStylesheet
+    from node_editor.widgets.editor_window import NodeEditorWindow
+
     app = QApplication(sys.argv)
 
     wnd = NodeEditorWindow()
-    module_path = os.path.dirname(inspect.getfile(wnd.__class__))
+    module_path = os.path.dirname(sys.modules[wnd.__class__.__module__].__file__)
 
     loadStylesheet(os.path.join(module_path, "qss/nodestyle.qss"))
 
@@ -11,11 +11,9 @@ import logging
 import os
 import sys
 
-from PyQt5.QtWidgets import QApplication
-
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from examples.string_processor.str_window import StringProcessorWindow
+from examples.string_processor import str_conf
 from node_editor.utils.logging_config import setup_logging
 
 logger = logging.getLogger(__name__)
@@ -24,6 +22,13 @@ if __name__ == '__main__':
     setup_logging()
     logger.info("Starting String Processor Example")
 
+    # GUI modules are only needed once we actually launch
+    from PyQt5.QtWidgets import QApplication
+
+    from examples.string_processor.str_window import StringProcessorWindow
+
+    str_conf.load_nodes()
+
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
 
@@ -1,14 +1,11 @@
-"""String Processor nodes package."""
+"""String Processor nodes package.
 
-from examples.string_processor.nodes.str_input import StrTextInput
-from examples.string_processor.nodes.str_operations import (
-    StrConcat,
-    StrFormat,
-    StrLength,
-    StrSplit,
-    StrSubstring,
-)
-from examples.string_processor.nodes.str_output import StrTextOutput
+Node classes are resolved lazily through the module ``__getattr__``, so
+importing the package does not pull in the Qt widget modules until a
+node class is first used.
+"""
+
+import importlib
 
 __all__ = [
     'StrTextInput',
@@ -19,3 +16,21 @@ __all__ = [
     'StrSubstring',
     'StrSplit',
 ]
+
+_LAZY = {
+    'StrTextInput': 'examples.string_processor.nodes.str_input',
+    'StrTextOutput': 'examples.string_processor.nodes.str_output',
+    'StrConcat': 'examples.string_processor.nodes.str_operations',
+    'StrFormat': 'examples.string_processor.nodes.str_operations',
+    'StrLength': 'examples.string_processor.nodes.str_operations',
+    'StrSubstring': 'examples.string_processor.nodes.str_operations',
+    'StrSplit': 'examples.string_processor.nodes.str_operations',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
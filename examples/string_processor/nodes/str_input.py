@@ -6,38 +6,50 @@ Author: Michael Economou
 Date: 2025-12-14
 """
 
-from PyQt5.QtWidgets import QLineEdit, QVBoxLayout
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QLineEdit
 
 from examples.string_processor.str_conf import OP_NODE_TEXT_INPUT, register_node
 from examples.string_processor.str_node_base import (
     StrGraphicsNode,
     StrNode,
     get_icon_path,
+    make_vbox,
 )
 from node_editor.core.socket import RIGHT_CENTER
 from node_editor.widgets.content_widget import QDMNodeContentWidget
 
+# quiet period after the last keystroke before the graph is re-evaluated
+EVAL_DEBOUNCE_MS = 200
+
 
 class StrTextInputContent(QDMNodeContentWidget):
     """Content widget with text input field."""
 
+    __slots__ = ("edit", "_debounce")
+
     def init_ui(self):
         """Initialize the text input field."""
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 5, 10, 5)
-        self.setLayout(layout)
-
         self.edit = QLineEdit("", self)
         self.edit.setObjectName("str_input_edit")
         self.edit.textChanged.connect(self.on_value_changed)
-        layout.addWidget(self.edit)
+        make_vbox(self, self.edit)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(EVAL_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._do_eval)
 
     def on_value_changed(self):
-        """Handle value changes and trigger node evaluation."""
-        if hasattr(self.node, 'mark_dirty'):
-            self.node.mark_dirty()
-        if hasattr(self.node, 'eval'):
-            self.node.eval()
+        """Mark the node dirty and schedule a single evaluation once typing pauses."""
+        self.node.mark_dirty()
+        self._debounce.start()
+
+    def _do_eval(self):
+        # the node may have been removed while the timer was pending
+        if self.node.graphics_node is None:
+            return
+        self.node.eval()
 
     def serialize(self):
         """Serialize the input value."""
@@ -66,6 +78,8 @@ class StrTextInput(StrNode):
     Outputs: 1 (string value)
     """
 
+    __slots__ = ("_last_emitted",)
+
     icon = get_icon_path("icons/text_in.svg")
     op_code = OP_NODE_TEXT_INPUT
     op_title = "Text Input"
@@ -83,6 +97,8 @@ class StrTextInput(StrNode):
         """
         super().__init__(scene, inputs=[], outputs=[5])
         self.value = ""
+        # last text pushed to children; None until one has been
+        self._last_emitted = None
         self.mark_dirty()
 
     def init_settings(self):
@@ -92,12 +108,17 @@ class StrTextInput(StrNode):
 
     def eval_implementation(self):
         """Return the text value from the input field."""
-        self.value = self.content.edit.text()
+        self.store_value(self.content.edit.text())
         self.mark_dirty(False)
         self.mark_invalid(False)
-        self.graphics_node.setToolTip(f"Text: {self.value!r}")
 
-        self.mark_descendants_dirty()
-        self.eval_children()
+        # Unchanged text leaves clean children clean, so eval_children only
+        # reaches nodes that were already dirty (e.g. newly connected ones).
+        if self.value != self._last_emitted:
+            self._last_emitted = self.value
+            self.graphics_node.setToolTip(f"Text: {self.value!r}")
+            self.propagate_to_children()
+        elif not StrNode._propagation_suspended:
+            self.eval_children()
 
         return self.value
@@ -17,6 +17,11 @@ from examples.string_processor.str_conf import (
 from examples.string_processor.str_node_base import StrNode, StrOpGraphicsNode, get_icon_path
 
 
+def _as_str(x):
+    """Return ``x`` as a string, skipping the ``str()`` call for strings."""
+    return x if x.__class__ is str else str(x)
+
+
 @register_node(OP_NODE_CONCAT)
 class StrConcat(StrNode):
     """Node for concatenating two strings.
@@ -50,7 +55,7 @@ class StrConcat(StrNode):
         Returns:
             Concatenated string.
         """
-        return str(input1) + str(input2)
+        return _as_str(input1) + _as_str(input2)
 
 
 @register_node(OP_NODE_FORMAT)
@@ -64,6 +69,8 @@ class StrFormat(StrNode):
     Outputs: 1 (formatted string)
     """
 
+    __slots__ = ("_last_format",)
+
     icon = get_icon_path("icons/format.svg")
     op_code = OP_NODE_FORMAT
     op_title = "Format"
@@ -75,6 +82,8 @@ class StrFormat(StrNode):
     def __init__(self, scene):
         """Create a format node."""
         super().__init__(scene, inputs=[5, 5], outputs=[5])
+        # (template, value, result) of the previous string evaluation
+        self._last_format = None
 
     def eval_operation(self, template, value):
         """Format string with value.
@@ -86,7 +95,17 @@ class StrFormat(StrNode):
         Returns:
             Formatted string.
         """
-        return str(template).format(value)
+        template = _as_str(template)
+        # only str values are memoised: they are immutable, and equal values
+        # of other types (1, 1.0, True) would format differently
+        if value.__class__ is not str:
+            return template.format(value)
+        last = self._last_format
+        if last is not None and last[0] == template and last[1] == value:
+            return last[2]
+        result = template.format(value)
+        self._last_format = (template, value, result)
+        return result
 
 
 @register_node(OP_NODE_LENGTH)
@@ -121,7 +140,7 @@ class StrLength(StrNode):
         Returns:
             Length of the string.
         """
-        return len(str(text))
+        return len(_as_str(text))
 
 
 @register_node(OP_NODE_SUBSTRING)
@@ -158,7 +177,7 @@ class StrSubstring(StrNode):
         Returns:
             Substring from start to end.
         """
-        text = str(text)
+        text = _as_str(text)
         start_idx = int(start) if start else 0
         end_idx = int(end) if end else len(text)
         return text[start_idx:end_idx]
@@ -197,4 +216,4 @@ class StrSplit(StrNode):
         Returns:
             List of string parts.
         """
-        return str(text).split(str(delimiter))
+        return _as_str(text).split(_as_str(delimiter))
@@ -7,13 +7,14 @@ Date: 2025-12-14
 """
 
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QLabel, QVBoxLayout
+from PyQt5.QtWidgets import QLabel
 
 from examples.string_processor.str_conf import OP_NODE_TEXT_OUTPUT, register_node
 from examples.string_processor.str_node_base import (
     StrGraphicsNode,
     StrNode,
     get_icon_path,
+    make_vbox,
 )
 from node_editor.core.socket import LEFT_CENTER
 from node_editor.widgets.content_widget import QDMNodeContentWidget
@@ -22,18 +23,18 @@ from node_editor.widgets.content_widget import QDMNodeContentWidget
 class StrTextOutputContent(QDMNodeContentWidget):
     """Content widget with result display label."""
 
+    __slots__ = ("label", "_last_text")
+
     def init_ui(self):
         """Initialize the output display label."""
-        layout = QVBoxLayout()
-        layout.setContentsMargins(10, 5, 10, 5)
-        self.setLayout(layout)
-
         self.label = QLabel("--", self)
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setObjectName("str_output_label")
         self.label.setWordWrap(True)
         self.label.setMaximumWidth(160)
-        layout.addWidget(self.label)
+        make_vbox(self, self.label)
+        # mirrors the label text so repeated values skip the Qt round trip
+        self._last_text = "--"
 
     def set_value(self, value):
         """Update the displayed value.
@@ -42,12 +43,15 @@ class StrTextOutputContent(QDMNodeContentWidget):
             value: Value to display (will be converted to string).
         """
         if value is None:
-            self.label.setText("--")
+            text = "--"
         else:
-            text = str(value)
+            text = value if type(value) is str else str(value)
             # Truncate if too long
             if len(text) > 50:
                 text = text[:47] + "..."
+        # setText relayouts the word-wrapped label; skip it when unchanged
+        if text != self._last_text:
+            self._last_text = text
             self.label.setText(text)
 
 
@@ -114,6 +118,8 @@ class StrTextOutput(StrNode):
         self.mark_dirty(False)
         self.mark_invalid(False)
         self.content.set_value(self.value)
-        self.graphics_node.setToolTip(f"Output: {self.value!r}")
+        tooltip = f"Output: {self.value!r}"
+        if self.graphics_node.toolTip() != tooltip:
+            self.graphics_node.setToolTip(tooltip)
 
         return self.value
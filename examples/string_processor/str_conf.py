@@ -6,6 +6,9 @@ Author: Michael Economou
 Date: 2025-12-14
 """
 
+import functools
+import importlib
+
 LISTBOX_MIMETYPE = "application/x-item"
 
 # Op codes for string processor nodes (200-219)
@@ -17,8 +20,12 @@ OP_NODE_LENGTH = 205
 OP_NODE_SUBSTRING = 206
 OP_NODE_SPLIT = 207
 
-# Node registry
-STR_NODES = {}
+# Node registry, exposed as ``STR_NODES`` through the module ``__getattr__``
+# so the node modules are only imported when the registry is first needed.
+_STR_NODES = {}
+_nodes_loaded = False
+# guards re-entry while node modules, which import this module back, load
+_nodes_loading = False
 
 
 class ConfError(Exception):
@@ -35,12 +42,13 @@ class OpCodeNotRegisteredError(ConfError):
 
 def register_node_now(op_code, class_reference):
     """Register a node class with an op code."""
-    if op_code in STR_NODES:
+    if op_code in _STR_NODES:
         raise InvalidNodeRegistrationError(
             f"Duplicate node registration of '{op_code}'. "
-            f"There is already {STR_NODES[op_code]}"
+            f"There is already {_STR_NODES[op_code]}"
         )
-    STR_NODES[op_code] = class_reference
+    _STR_NODES[op_code] = class_reference
+    get_class_from_opcode.cache_clear()
 
 
 def register_node(op_code):
@@ -51,12 +59,35 @@ def register_node(op_code):
     return decorator
 
 
+@functools.cache
 def get_class_from_opcode(op_code):
     """Get node class from op code."""
-    if op_code not in STR_NODES:
-        raise OpCodeNotRegisteredError(f"OpCode '{op_code}' is not registered")
-    return STR_NODES[op_code]
-
-
-# Import all nodes and register them
-from examples.string_processor.nodes import *
+    load_nodes()
+    try:
+        return _STR_NODES[op_code]
+    except KeyError:
+        raise OpCodeNotRegisteredError(f"OpCode '{op_code}' is not registered") from None
+
+
+def load_nodes():
+    """Import every node class so its ``register_node`` decorator runs."""
+    global _nodes_loaded, _nodes_loading
+    if _nodes_loaded or _nodes_loading:
+        return
+    _nodes_loading = True
+    try:
+        package = importlib.import_module("examples.string_processor.nodes")
+        # the package resolves its classes lazily; touching each one imports it
+        for name in package.__all__:
+            getattr(package, name)
+        _nodes_loaded = True
+    finally:
+        _nodes_loading = False
+
+
+def __getattr__(name):
+    if name == "STR_NODES":
+        load_nodes()
+        globals()["STR_NODES"] = _STR_NODES
+        return _STR_NODES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,15 +6,35 @@ Author: Michael Economou
 Date: 2025-12-14
 """
 
+import functools
+import re
+
 from PyQt5.QtCore import QByteArray, QDataStream, QIODevice, QMimeData, QPoint, QSize, Qt
 from PyQt5.QtGui import QDrag, QIcon, QPainter, QPixmap
 from PyQt5.QtSvg import QSvgRenderer
 from PyQt5.QtWidgets import QAbstractItemView, QApplication, QListWidget, QListWidgetItem
 
-from examples.string_processor.str_conf import LISTBOX_MIMETYPE, STR_NODES, get_class_from_opcode
+from examples.string_processor.str_conf import LISTBOX_MIMETYPE, STR_NODES
 from node_editor.themes.theme_engine import ThemeEngine
 from node_editor.utils.helpers import dump_exception
 
+# dark fill colours used by the bundled Material Design icons
+_FILL_RE = re.compile(rb'fill="(?:#000000|#000|black|#212121)"')
+
+# rendered icons keyed by (svg_path, rgba, size); a theme switch changes the
+# colour and therefore the key, so entries never go stale
+_SVG_PIXMAP_CACHE: dict[tuple, QPixmap] = {}
+
+_ITEM_SIZE = QSize(32, 32)
+_ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+
+@functools.cache
+def _read_svg(svg_path):
+    """Return the raw bytes of an icon file, read once per process."""
+    with open(svg_path, 'rb') as f:
+        return f.read()
+
 
 class StrDragListbox(QListWidget):
     """Listbox with draggable string processing nodes."""
@@ -44,31 +64,30 @@ class StrDragListbox(QListWidget):
         Returns:
             QPixmap with the colorized SVG, or None on error.
         """
+        key = (svg_path, color.rgba(), size)
+        cached = _SVG_PIXMAP_CACHE.get(key)
+        if cached is not None:
+            return cached
         try:
-            # Read SVG file
-            with open(svg_path) as f:
-                svg_content = f.read()
+            svg_bytes = _read_svg(svg_path)
 
-            # Replace fill colors with the theme color
-            color_hex = color.name()  # e.g., "#cccccc"
+            fill = b'fill="%s"' % color.name().encode('ascii')  # e.g. fill="#cccccc"
 
-            # Replace common fill patterns in Material Design icons
-            svg_content = svg_content.replace('fill="#000000"', f'fill="{color_hex}"')
-            svg_content = svg_content.replace('fill="#000"', f'fill="{color_hex}"')
-            svg_content = svg_content.replace('fill="black"', f'fill="{color_hex}"')
-            svg_content = svg_content.replace('fill="#212121"', f'fill="{color_hex}"')
+            # Replace common fill patterns in Material Design icons in one pass
+            svg_bytes = _FILL_RE.sub(fill, svg_bytes)
 
             # If no fill attribute, add one to the root svg element
-            if 'fill=' not in svg_content:
-                svg_content = svg_content.replace('<svg ', f'<svg fill="{color_hex}" ')
+            if b'fill=' not in svg_bytes:
+                svg_bytes = svg_bytes.replace(b'<svg ', b'<svg ' + fill + b' ', 1)
 
             # Render the modified SVG
-            renderer = QSvgRenderer(QByteArray(svg_content.encode('utf-8')))
+            renderer = QSvgRenderer(QByteArray(svg_bytes))
             pixmap = QPixmap(size, size)
             pixmap.fill(Qt.transparent)
             painter = QPainter(pixmap)
             renderer.render(painter)
             painter.end()
+            _SVG_PIXMAP_CACHE[key] = pixmap
             return pixmap
         except Exception as e:
             dump_exception(e)
@@ -76,11 +95,16 @@ class StrDragListbox(QListWidget):
 
     def add_my_items(self):
         """Add all registered nodes to the listbox."""
-        keys = list(STR_NODES.keys())
-        keys.sort()
-        for key in keys:
-            node = get_class_from_opcode(key)
-            self.add_my_item(node.op_title, node.icon, node.op_code)
+        # Populate in one batch: no repaint or itemChanged per inserted row
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for op_code, node in sorted(STR_NODES.items()):
+                self.add_my_item(node.op_title, node.icon, op_code)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.doItemsLayout()
 
     def add_my_item(self, name, icon=None, op_code=0):
         """Add an item to the listbox.
@@ -90,7 +114,8 @@ class StrDragListbox(QListWidget):
             icon: Path to icon file (SVG).
             op_code: Operation code for the node.
         """
-        item = QListWidgetItem(name, self)
+        # configured detached, so the view only sees the finished item
+        item = QListWidgetItem(name)
 
         # Get icon color from theme
         theme = ThemeEngine.current_theme()
@@ -108,14 +133,15 @@ class StrDragListbox(QListWidget):
             pixmap = QPixmap(".")
             item.setIcon(QIcon(pixmap))
 
-        item.setSizeHint(QSize(32, 32))
-        item.setText(name)
-        item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled)
+        item.setSizeHint(_ITEM_SIZE)
+        item.setFlags(_ITEM_FLAGS)
 
         # Store data
         item.setData(Qt.UserRole, pixmap)
         item.setData(Qt.UserRole + 1, op_code)
 
+        self.addItem(item)
+
     def mousePressEvent(self, event):
         """Record press position for drag threshold."""
         if event.button() == Qt.LeftButton:
@@ -145,7 +171,10 @@ class StrDragListbox(QListWidget):
             item = self.currentItem()
             op_code = item.data(Qt.UserRole + 1)
 
-            pixmap = QPixmap(item.data(Qt.UserRole))
+            # the stored QPixmap is implicitly shared; no copy needed
+            pixmap = item.data(Qt.UserRole)
+            if pixmap is None:  # icon failed to load
+                pixmap = QPixmap()
 
             item_data = QByteArray()
             data_stream = QDataStream(item_data, QIODevice.WriteOnly)
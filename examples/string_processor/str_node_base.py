@@ -6,12 +6,14 @@ Author: Michael Economou
 Date: 2025-12-14
 """
 
+import functools
 import logging
 import os
+from collections import deque
 
 from PyQt5.QtCore import QRectF
 from PyQt5.QtGui import QImage
-from PyQt5.QtWidgets import QLabel
+from PyQt5.QtWidgets import QLabel, QVBoxLayout
 
 from node_editor.core.node import Node
 from node_editor.core.socket import LEFT_CENTER, RIGHT_CENTER
@@ -20,10 +22,39 @@ from node_editor.widgets.content_widget import QDMNodeContentWidget
 
 logger = logging.getLogger(__name__)
 
+_THIS_DIR = os.path.dirname(__file__)
+
 
 class StrGraphicsNode(QDMGraphicsNode):
     """Graphics node for string processor input/output nodes."""
 
+    # status icon atlas shared by every string node; None if no file was found
+    _icons_cache: QImage | None = None
+    _icons_loaded = False
+
+    # status icon source rects indexed by StrNode._status_bits
+    # (bit 0 dirty, bit 1 invalid; invalid wins over dirty)
+    _STATUS_RECTS = (
+        QRectF(24.0, 0, 24.0, 24.0),
+        QRectF(0.0, 0, 24.0, 24.0),
+        QRectF(48.0, 0, 24.0, 24.0),
+        QRectF(48.0, 0, 24.0, 24.0),
+    )
+    _STATUS_TARGET = QRectF(-10, -10, 24.0, 24.0)
+
+    @staticmethod
+    def _load_icons():
+        """Return the shared status icon atlas, loading it on first use."""
+        if not StrGraphicsNode._icons_loaded:
+            candidates = (
+                os.path.join(_THIS_DIR, "icons", "status_icons.png"),
+                os.path.join(_THIS_DIR, "..", "..", "calculator", "icons", "status_icons.png"),
+            )
+            path = next((p for p in candidates if os.path.exists(p)), None)
+            StrGraphicsNode._icons_cache = QImage(path) if path is not None else None
+            StrGraphicsNode._icons_loaded = True
+        return StrGraphicsNode._icons_cache
+
     def init_sizes(self):
         """Initialize size parameters."""
         super().init_sizes()
@@ -37,33 +68,17 @@ class StrGraphicsNode(QDMGraphicsNode):
     def init_assets(self):
         """Initialize status icons."""
         super().init_assets()
-        base_dir = os.path.dirname(__file__)
-        local_path = os.path.join(base_dir, "icons", "status_icons.png")
-        calc_path = os.path.join(base_dir, "..", "..", "calculator", "icons", "status_icons.png")
-        for candidate in (local_path, calc_path):
-            if os.path.exists(candidate):
-                self.icons = QImage(candidate)
-                break
-        else:
-            self.icons = None
+        self.icons = StrGraphicsNode._load_icons()
 
     def paint(self, painter, option, widget=None):
         """Paint the node with status indicator."""
-        super().paint(painter, option, widget)
-
         if self.icons is None:
-            return
-
-        offset = 24.0
-        if self.node.is_dirty():
-            offset = 0.0
-        if self.node.is_invalid():
-            offset = 48.0
-
+            return super().paint(painter, option, widget)
+        super().paint(painter, option, widget)
         painter.drawImage(
-            QRectF(-10, -10, 24.0, 24.0),
+            self._STATUS_TARGET,
             self.icons,
-            QRectF(offset, 0, 24.0, 24.0)
+            self._STATUS_RECTS[self.node._status_bits]
         )
 
 
@@ -89,6 +104,9 @@ class StrContent(QDMNodeContentWidget):
 class StrNode(Node):
     """Base class for string operation nodes."""
 
+    # base classes keep their __dict__; these attributes live in slots instead
+    __slots__ = ("value", "_generation", "_dep_gens", "_status_bits")
+
     icon = ""
     op_code = 0
     op_title = "String Operation"
@@ -98,6 +116,9 @@ class StrNode(Node):
     _graphics_node_class = StrGraphicsNode
     _content_widget_class = StrContent
 
+    # set while propagate_and_eval runs its ordered pass
+    _propagation_suspended = False
+
     def __init__(self, scene, inputs=None, outputs=None):
         """Initialize string node.
 
@@ -110,9 +131,15 @@ class StrNode(Node):
             inputs = [5, 5]  # String sockets
         if outputs is None:
             outputs = [5]
+        # set before super(): the graphics node may paint during construction
+        self._status_bits = 0
         super().__init__(scene, self.__class__.op_title, inputs, outputs)
 
         self.value = None
+        # bumped whenever value changes; children compare it to skip recomputing
+        self._generation = 0
+        # (input node, generation) pairs seen by the last computed evaluation
+        self._dep_gens = None
         self.graphics_node.setToolTip("Not evaluated yet")
         self.mark_dirty()
 
@@ -122,6 +149,14 @@ class StrNode(Node):
         self.input_socket_position = LEFT_CENTER
         self.output_socket_position = RIGHT_CENTER
 
+    def mark_dirty(self, new_value=True):
+        super().mark_dirty(new_value)
+        self._status_bits = self._is_dirty | (self._is_invalid << 1)
+
+    def mark_invalid(self, new_value=True):
+        super().mark_invalid(new_value)
+        self._status_bits = self._is_dirty | (self._is_invalid << 1)
+
     def eval(self, _index=0):
         """Evaluate this node and return its value.
 
@@ -131,22 +166,37 @@ class StrNode(Node):
         Returns:
             The computed value or cached value if clean.
         """
-        if not self.is_dirty() and not self.is_invalid():
-            logger.debug("Returning cached %s value: %r", self.__class__.__name__, self.value)
+        # cache hits dominate once the graph is clean; read the flags directly
+        if not self._is_dirty and not self._is_invalid:
             return self.value
 
         try:
-            val = self.eval_implementation()
-            return val
+            return self.eval_implementation()
         except Exception as e:
-            self.value = None
+            self.store_value(None)
+            self._dep_gens = None
             self.mark_invalid()
             self.graphics_node.setToolTip(str(e))
-            self.mark_descendants_dirty()
-            self.eval_children()
+            self.propagate_to_children()
             logger.error("%s eval error: %s", self.__class__.__name__, e)
             return None
 
+    def propagate_to_children(self):
+        """Re-evaluate every downstream node after this node's value changed."""
+        if StrNode._propagation_suspended:
+            return
+        propagate_and_eval(self)
+
+    def store_value(self, value):
+        """Set ``value``, bumping the generation if it changed.
+
+        Args:
+            value: New node value.
+        """
+        if value != self.value:
+            self._generation += 1
+        self.value = value
+
     def eval_operation(self, *_args):
         """Perform the string operation. Override in subclasses.
 
@@ -161,31 +211,48 @@ class StrNode(Node):
     def eval_implementation(self):
         """Evaluate the node operation."""
         # Get input values by calling eval() on connected nodes
-        inputs = []
-        for i in range(len(self.inputs)):
-            input_node = self.get_input(i)
+        get_input = self.get_input
+        count = len(self.inputs)
+        inputs = [None] * count
+        dep_gens = [None] * count
+        for i in range(count):
+            input_node = get_input(i)
             if input_node is None:
-                self.value = None
+                self.store_value(None)
+                self._dep_gens = None
                 self.mark_invalid()
-                self.mark_descendants_dirty()
                 self.graphics_node.setToolTip(f"Connect input {i+1}")
-                self.eval_children()
+                self.propagate_to_children()
                 return None
             # Call eval() on the input node to get its value
-            input_val = input_node.eval()
-            inputs.append(input_val)
+            inputs[i] = input_node.eval()
+            dep_gens[i] = (input_node, getattr(input_node, "_generation", None))
+
+        # Same inputs at the same generations: the previous result still holds,
+        # and children only need settling, not invalidating
+        if dep_gens == self._dep_gens and not self.is_invalid():
+            self.mark_dirty(False)
+            if not StrNode._propagation_suspended:
+                self.eval_children()
+            return self.value
 
         # Perform operation
         try:
-            self.value = self.eval_operation(*inputs)
+            generation = self._generation
+            was_invalid = self.is_invalid()
+            self.store_value(self.eval_operation(*inputs))
+            # inputs without a generation (plain Node) can't be trusted to repeat
+            self._dep_gens = None if any(g is None for _, g in dep_gens) else dep_gens
             self.mark_dirty(False)
             self.mark_invalid(False)
-            self.graphics_node.setToolTip(f"{self.op_title}: {self.value!r}")
-            self.mark_descendants_dirty()
-            self.eval_children()
+            # an unchanged value keeps its tooltip, unless an error/placeholder replaced it
+            if self._generation != generation or was_invalid or not generation:
+                self.graphics_node.setToolTip(f"{self.op_title}: {self.value!r}")
+            self.propagate_to_children()
             return self.value
         except Exception as e:
-            self.value = None
+            self.store_value(None)
+            self._dep_gens = None
             self.mark_invalid()
             self.graphics_node.setToolTip(f"Error: {e}")
             logger.error("%s eval error: %s", self.op_title, e)
@@ -203,6 +270,88 @@ class StrNode(Node):
         return res
 
 
+def _downstream_order(roots):
+    """Return *roots* and everything downstream of them, dependencies first.
+
+    Nodes are collected breadth-first and ordered with Kahn's algorithm.
+    Nodes on a cycle never become ready and are left out.
+    """
+    children = {}
+    indegree = dict.fromkeys(roots, 0)
+    queue = deque(indegree)
+    while queue:
+        node = queue.popleft()
+        kids = children[node] = node.get_children_nodes()
+        for kid in kids:
+            if kid not in indegree:
+                indegree[kid] = 0
+                queue.append(kid)
+            indegree[kid] += 1
+
+    order = []
+    ready = deque(node for node, count in indegree.items() if count == 0)
+    while ready:
+        node = ready.popleft()
+        order.append(node)
+        for kid in children[node]:
+            indegree[kid] -= 1
+            if indegree[kid] == 0:
+                ready.append(kid)
+    return order
+
+
+def _eval_in_order(order):
+    """Mark *order* dirty, then evaluate it with the per-node cascade suspended."""
+    for node in order:
+        node.mark_dirty()
+
+    StrNode._propagation_suspended = True
+    try:
+        for node in order:
+            node.eval()
+    finally:
+        StrNode._propagation_suspended = False
+
+
+def propagate_and_eval(root):
+    """Mark everything downstream of *root* dirty and evaluate it once.
+
+    A node reachable along several paths is computed a single time instead
+    of once per path.
+
+    Args:
+        root: Node whose value has just changed.
+    """
+    _eval_in_order([node for node in _downstream_order([root]) if node is not root])
+
+
+def eval_all(nodes):
+    """Evaluate every node in *nodes* exactly once, dependencies first.
+
+    Args:
+        nodes: Nodes to evaluate, typically all nodes of a scene.
+    """
+    _eval_in_order(_downstream_order(nodes))
+
+
+def make_vbox(parent, child, margins=(10, 5, 10, 5)):
+    """Install a vertical layout holding a single child widget.
+
+    Args:
+        parent: Widget that receives the layout.
+        child: Widget to place in the layout.
+        margins: Contents margins as (left, top, right, bottom).
+
+    Returns:
+        The installed QVBoxLayout.
+    """
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    layout.addWidget(child)
+    return layout
+
+
+@functools.cache
 def get_icon_path(relative_path):
     """Get absolute path for icon file.
 
@@ -212,4 +361,4 @@ def get_icon_path(relative_path):
     Returns:
         Absolute path to the icon file.
     """
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), relative_path))
+    return os.path.abspath(os.path.join(_THIS_DIR, relative_path))
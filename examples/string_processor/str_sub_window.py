@@ -8,10 +8,9 @@ Date: 2025-12-14
 
 import logging
 
-from examples.string_processor.str_conf import (
-    LISTBOX_MIMETYPE,
-    get_class_from_opcode,
-)
+from examples.string_processor.str_conf import LISTBOX_MIMETYPE, get_class_from_opcode
+from examples.string_processor.str_node_base import eval_all
+from node_editor.core.node import Node
 from node_editor.utils.helpers import dump_exception
 from node_editor.widgets.editor_widget import NodeEditorWidget
 
@@ -41,10 +40,10 @@ class StrSubWindow(NodeEditorWidget):
 
     def get_node_class_from_data(self, data):
         """Get node class from serialized data."""
-        if 'op_code' not in data:
-            from node_editor.core.node import Node
+        op_code = data.get('op_code')
+        if op_code is None:
             return Node
-        return get_class_from_opcode(data['op_code'])
+        return get_class_from_opcode(op_code)
 
     def file_load(self, filename):
         """Load scene from file."""
@@ -55,18 +54,8 @@ class StrSubWindow(NodeEditorWidget):
         return False
 
     def do_eval_outputs(self):
-        """Force evaluation of all nodes after load."""
-        # First mark all input nodes dirty and evaluate them
-        for node in self.scene.nodes:
-            if node.__class__.__name__ == "StrTextInput":
-                node.mark_dirty()
-                node.eval()
-
-        # Then evaluate all other nodes including outputs
-        for node in self.scene.nodes:
-            if node.__class__.__name__ != "StrTextInput":
-                node.mark_dirty()
-                node.eval()
+        """Force evaluation of all nodes after load, each exactly once."""
+        eval_all(self.scene.nodes)
 
     def on_history_restored(self):
         """Handle history restore event."""
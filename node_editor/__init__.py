@@ -55,16 +55,28 @@ _init_graphics_classes()
 from node_editor.core import Edge, Node, Socket
 from node_editor.core.scene import Scene
 
-# Node system
-from node_editor.nodes import NodeRegistry
+# Node system, themes and widgets are resolved on first access (PEP 562) so
+# ``import node_editor`` does not load every built-in node module, the theme
+# stylesheets and the editor window for callers that only need the core.
+_LAZY = {
+    "NodeRegistry": "node_editor.nodes",
+    "ThemeEngine": "node_editor.themes",
+    "DarkTheme": "node_editor.themes.dark",
+    "LightTheme": "node_editor.themes.light",
+    "NodeEditorWidget": "node_editor.widgets",
+    "NodeEditorWindow": "node_editor.widgets",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Theme engine
-from node_editor.themes import ThemeEngine
-from node_editor.themes.dark import DarkTheme
-from node_editor.themes.light import LightTheme
-
-# Widgets
-from node_editor.widgets import NodeEditorWidget, NodeEditorWindow
 
 __all__ = [
     "__version__",
@@ -100,6 +100,8 @@ class Scene(Serializable):
         self._has_been_modified_listeners: list[Callable] = []
         self._item_selected_listeners: list[Callable] = []
         self._items_deselected_listeners: list[Callable] = []
+        self._node_added_listeners: list[Callable] = []
+        self._node_removed_listeners: list[Callable] = []
 
         self.node_class_selector: Callable[[dict], type[Node]] | None = None
 
@@ -170,6 +172,8 @@ class Scene(Serializable):
             node: Node instance to add.
         """
         self.nodes.append(node)
+        for callback in self._node_added_listeners:
+            callback(node)
 
     def add_edge(self, edge: Edge) -> None:
         """Register an edge with this scene.
@@ -192,6 +196,8 @@ class Scene(Serializable):
         """
         if node in self.nodes:
             self.nodes.remove(node)
+            for callback in self._node_removed_listeners:
+                callback(node)
 
     def remove_edge(self, edge: Edge) -> None:
         """Unregister an edge from this scene.
@@ -354,6 +360,27 @@ class Scene(Serializable):
         """
         self._items_deselected_listeners.append(callback)
 
+    def add_node_added_listener(self, callback: Callable) -> None:
+        """Register callback for nodes being added to the scene.
+
+        Callback receives the added Node. It runs from Node.__init__,
+        before the node's sockets are created.
+
+        Args:
+            callback: Function to call when a node is registered.
+        """
+        self._node_added_listeners.append(callback)
+
+    def add_node_removed_listener(self, callback: Callable) -> None:
+        """Register callback for nodes being removed from the scene.
+
+        Callback receives the removed Node.
+
+        Args:
+            callback: Function to call when a node is unregistered.
+        """
+        self._node_removed_listeners.append(callback)
+
     def _get_graphics_view(self):
         """Internal helper to access graphics view through graphics_scene.
 
@@ -33,6 +33,7 @@ from node_editor.graphics.edge_path import (
     GraphicsEdgePathImprovedSharp,
     GraphicsEdgePathSquare,
 )
+from node_editor.graphics.node import ITEM_KIND_EDGE
 from node_editor.themes.theme_engine import ThemeEngine
 
 if TYPE_CHECKING:
@@ -50,6 +51,7 @@ class QDMGraphicsEdge(QGraphicsPathItem):
     hover highlighting.
 
     Attributes:
+        item_kind: ITEM_KIND_EDGE tag shared by all graphics edges.
         edge: Reference to logical Edge model.
         path_calculator: Instance computing the connection path.
         pos_source: [x, y] source position in scene coordinates.
@@ -57,6 +59,8 @@ class QDMGraphicsEdge(QGraphicsPathItem):
         hovered: True while mouse hovers over this edge.
     """
 
+    item_kind = ITEM_KIND_EDGE
+
     def __init__(self, edge: Edge, parent: QWidget | None = None):
         """Initialize graphics edge for a logical edge.
 
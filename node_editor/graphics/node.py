@@ -37,6 +37,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Integer tags read through ``item_kind`` so callers can classify a hit
+# item with one attribute lookup instead of chained hasattr() probes.
+ITEM_KIND_NONE = 0
+ITEM_KIND_NODE = 1
+ITEM_KIND_SOCKET = 2
+ITEM_KIND_EDGE = 3
+
 
 class QDMGraphicsNode(QGraphicsItem):
     """Qt graphics item rendering a node in the scene.
@@ -46,6 +53,7 @@ class QDMGraphicsNode(QGraphicsItem):
     Handles mouse interactions for selection, movement, and double-click.
 
     Attributes:
+        item_kind: ITEM_KIND_NODE tag shared by all graphics nodes.
         node: Reference to the logical Node model.
         hovered: True while mouse is over this item.
         width: Node width in pixels.
@@ -54,6 +62,8 @@ class QDMGraphicsNode(QGraphicsItem):
         graphics_content: QGraphicsProxyWidget containing content widget.
     """
 
+    item_kind = ITEM_KIND_NODE
+
     def __init__(self, node: Node, parent: QWidget | None = None):
         """Initialize graphics node for a logical node.
 
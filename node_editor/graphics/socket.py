@@ -22,6 +22,7 @@ from PyQt5.QtCore import QRectF, Qt
 from PyQt5.QtGui import QBrush, QColor, QPen
 from PyQt5.QtWidgets import QGraphicsItem
 
+from node_editor.graphics.node import ITEM_KIND_SOCKET
 from node_editor.themes.theme_engine import ThemeEngine
 
 if TYPE_CHECKING:
@@ -36,12 +37,15 @@ class QDMGraphicsSocket(QGraphicsItem):
     compatibility checking.
 
     Attributes:
+        item_kind: ITEM_KIND_SOCKET tag shared by all graphics sockets.
         socket: Reference to logical Socket model.
         isHighlighted: True when highlighted during connection drag.
         radius: Socket circle radius in pixels.
         outline_width: Width of socket outline stroke.
     """
 
+    item_kind = ITEM_KIND_SOCKET
+
     def __init__(self, socket: "Socket"):
         """Initialize graphics socket for a logical socket.
 
@@ -19,18 +19,29 @@ from typing import Any
 
 from node_editor.utils.helpers import dump_exception
 
+try:
+    import orjson
+except ImportError:  # optional speed-up, see the "fast" extra
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class InvalidFileError(Exception):
     """Raised when file loading fails due to invalid format or content."""
 
 
 def read_snapshot_from_file(filename: str) -> dict[str, Any]:
-    """Read a snapshot dict from disk."""
-    with open(filename) as file:
+    """Read a snapshot dict from disk.
+
+    Uses ``orjson`` for parsing when it is installed, ``json`` otherwise.
+    """
+    with open(filename, "rb") as file:
         raw_data = file.read()
 
     try:
-        data = json.loads(raw_data)
+        data = _json_loads(raw_data)
         if not isinstance(data, dict):
             raise InvalidFileError(f"{os.path.basename(filename)} does not contain a JSON object")
         return data
@@ -13,6 +13,7 @@ and logging configuration.
 Functions:
     loadStylesheet: Load a single QSS stylesheet to QApplication.
     loadStylesheets: Load and concatenate multiple QSS stylesheets.
+    read_stylesheets: Read and concatenate QSS files without applying them.
     is_ctrl_pressed: Check if Control modifier is active.
     is_shift_pressed: Check if Shift modifier is active.
     is_alt_pressed: Check if Alt modifier is active.
@@ -36,6 +37,7 @@ from node_editor.utils.qt_helpers import (
     is_shift_pressed,
     loadStylesheet,
     loadStylesheets,
+    read_stylesheets,
 )
 
 __all__ = [
@@ -43,6 +45,7 @@ __all__ = [
     "pp",
     "loadStylesheet",
     "loadStylesheets",
+    "read_stylesheets",
     "is_ctrl_pressed",
     "is_shift_pressed",
     "is_alt_pressed",
@@ -6,6 +6,7 @@ including stylesheet loading and keyboard modifier detection.
 Functions:
     loadStylesheet: Load a single QSS stylesheet.
     loadStylesheets: Load and concatenate multiple QSS stylesheets.
+    read_stylesheets: Read and concatenate QSS files without applying them.
     is_ctrl_pressed: Check if Control modifier is active.
     is_shift_pressed: Check if Shift modifier is active.
     is_alt_pressed: Check if Alt modifier is active.
@@ -49,6 +50,25 @@ def loadStylesheets(*filenames: str) -> None:
     Args:
         *filenames: Paths to QSS stylesheet files.
     """
+    combined = read_stylesheets(*filenames)
+
+    app = QApplication.instance()
+    if app:
+        app.setStyleSheet(combined)
+
+
+def read_stylesheets(*filenames: str) -> str:
+    """Read and concatenate QSS stylesheets.
+
+    Unreadable files are skipped. The result is not applied, so callers
+    can cache it and set it on the application themselves.
+
+    Args:
+        *filenames: Paths to QSS stylesheet files.
+
+    Returns:
+        Combined stylesheet text.
+    """
     combined = ""
     for filename in filenames:
         file = QFile(filename)
@@ -56,10 +76,7 @@ def loadStylesheets(*filenames: str) -> None:
             continue
         stylesheet = file.readAll()
         combined += "\n" + str(stylesheet, encoding="utf-8")
-
-    app = QApplication.instance()
-    if app:
-        app.setStyleSheet(combined)
+    return combined
 
 
 def is_ctrl_pressed(event) -> bool:
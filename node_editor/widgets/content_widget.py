@@ -19,6 +19,7 @@ from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import QLabel, QTextEdit, QVBoxLayout, QWidget
 
 from node_editor.core.serializable import Serializable
+from node_editor.graphics.node import ITEM_KIND_NODE
 
 if TYPE_CHECKING:
     from PyQt5.QtGui import QFocusEvent
@@ -33,10 +34,13 @@ class QDMNodeContentWidget(QWidget, Serializable):
     Subclass and override init_ui() to create custom node interfaces.
 
     Attributes:
+        item_kind: ITEM_KIND_NODE, so content hits resolve to the node.
         node: Parent Node containing this content.
         layout: QVBoxLayout for arranging child widgets.
     """
 
+    item_kind = ITEM_KIND_NODE
+
     def __init__(self, node: "Node", parent: QWidget | None = None):
         """Initialize content widget for a node.
 
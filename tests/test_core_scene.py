@@ -14,10 +14,17 @@ import json
 import os
 import tempfile
 
+import pytest
+
 from node_editor.core.edge import Edge
 from node_editor.core.node import Node
 from node_editor.core.scene import Scene
-from node_editor.persistence.scene_json import load_scene_from_file, save_scene_to_file
+from node_editor.persistence.scene_json import (
+    InvalidFileError,
+    load_scene_from_file,
+    read_snapshot_from_file,
+    save_scene_to_file,
+)
 
 
 class TestSceneCreation:
@@ -79,6 +86,26 @@ class TestSceneNodeManagement:
         assert node not in scene.nodes
         assert len(scene.nodes) == 0
 
+    def test_node_added_listener(self, scene):
+        """Test node added listeners receive the new node."""
+        added = []
+        scene.add_node_added_listener(added.append)
+
+        node = Node(scene, "Test Node")
+
+        assert added == [node]
+
+    def test_node_removed_listener(self, scene):
+        """Test node removed listeners fire only for registered nodes."""
+        removed = []
+        scene.add_node_removed_listener(removed.append)
+        node = Node(scene, "Test Node")
+
+        node.remove()
+        scene.remove_node(node)
+
+        assert removed == [node]
+
     def test_get_node_by_id(self, scene):
         """Test retrieving node by ID."""
         node = Node(scene, "Test Node")
@@ -231,6 +258,18 @@ class TestSceneFileOperations:
             if os.path.exists(filename):
                 os.unlink(filename)
 
+    def test_read_invalid_file(self, tmp_path):
+        """Test that malformed or non-object JSON raises InvalidFileError."""
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        with pytest.raises(InvalidFileError):
+            read_snapshot_from_file(str(bad))
+
+        listing = tmp_path / "list.json"
+        listing.write_text("[1, 2]")
+        with pytest.raises(InvalidFileError):
+            read_snapshot_from_file(str(listing))
+
 
 class TestSceneClear:
     """Test scene clearing operations."""
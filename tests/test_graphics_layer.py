@@ -13,6 +13,7 @@ Date:
 
 from node_editor.core.edge import Edge
 from node_editor.core.scene import Scene
+from node_editor.graphics.node import ITEM_KIND_EDGE, ITEM_KIND_NODE, ITEM_KIND_SOCKET
 from node_editor.graphics.view import QDMGraphicsView
 from node_editor.nodes.input_node import NumberInputNode
 from node_editor.nodes.math_nodes import AddNode
@@ -226,6 +227,19 @@ class TestGraphicsNode:
         nodes = [item for item in selected if hasattr(item, 'node')]
         assert len(nodes) == 2
 
+    def test_item_kind_tags(self, _qtbot):
+        """Test that graphics items carry their item_kind tag."""
+        scene = Scene()
+
+        node1 = NumberInputNode(scene)
+        node2 = AddNode(scene)
+        edge = Edge(scene, node1.outputs[0], node2.inputs[0])
+
+        assert node1.graphics_node.item_kind == ITEM_KIND_NODE
+        assert node1.content.item_kind == ITEM_KIND_NODE
+        assert node1.outputs[0].graphics_socket.item_kind == ITEM_KIND_SOCKET
+        assert edge.graphics_edge.item_kind == ITEM_KIND_EDGE
+
 
 class TestGraphicsEdge:
     """Tests for QDMGraphicsEdge visual representation."""
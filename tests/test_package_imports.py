@@ -110,3 +110,18 @@ class TestPackageImports(unittest.TestCase):
         assert hasattr(Node, "eval")
         assert hasattr(Node, "serialize")
         assert hasattr(Node, "deserialize")
+
+    def test_top_level_lazy_exports(self):
+        """Test that lazily exported names resolve from the package root."""
+        import node_editor
+        from node_editor.nodes import NodeRegistry
+        from node_editor.themes import ThemeEngine
+        from node_editor.widgets import NodeEditorWindow
+
+        assert node_editor.NodeRegistry is NodeRegistry
+        assert node_editor.ThemeEngine is ThemeEngine
+        assert node_editor.NodeEditorWindow is NodeEditorWindow
+        for name in node_editor.__all__:
+            assert getattr(node_editor, name) is not None
+        with self.assertRaises(AttributeError):
+            node_editor.DoesNotExist  # noqa: B018